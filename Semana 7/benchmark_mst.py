@@ -1,8 +1,6 @@
+import sys
 import time
 import random
-import matplotlib
-matplotlib.use('Agg') # Use non-interactive backend
-import matplotlib.pyplot as plt
 from mst import NetworkDesigner
 
 def generate_random_graph(num_nodes, density=0.3):
@@ -37,34 +35,69 @@ def generate_random_graph(num_nodes, density=0.3):
 def benchmark():
     sizes = [10, 100, 1000]
     prim_times = []
+    prim_auto_times = []
     kruskal_times = []
+    kruskal_fast_times = []
+    boruvka_times = []
+    filter_times = []
     
-    print(f"{'Nodes':<10} | {'Prim (s)':<15} | {'Kruskal (s)':<15}")
-    print("-" * 45)
+    print(f"{'Nodes':<10} | {'Prim (s)':<15} | {'Prim auto (s)':<15} | {'Kruskal (s)':<15} | {'Kruskal fast (s)':<15} | {'Borůvka (s)':<15} | {'Filter-Kr. (s)':<15}")
+    print("-" * 119)
     
     for n in sizes:
         # Generate graph
         g = generate_random_graph(n, density=0.2) # 20% density
         
         # Benchmark Prim
-        start_time = time.time()
+        start_time = time.perf_counter()
         g.prim_mst()
-        prim_time = time.time() - start_time
+        prim_time = time.perf_counter() - start_time
         prim_times.append(prim_time)
         
+        # Benchmark Prim with decrease-key heap / dense version chosen by density
+        start_time = time.perf_counter()
+        g.prim_mst_auto()
+        prim_auto_time = time.perf_counter() - start_time
+        prim_auto_times.append(prim_auto_time)
+        
         # Benchmark Kruskal
-        start_time = time.time()
+        start_time = time.perf_counter()
         g.kruskal_mst()
-        kruskal_time = time.time() - start_time
+        kruskal_time = time.perf_counter() - start_time
         kruskal_times.append(kruskal_time)
         
-        print(f"{n:<10} | {prim_time:<15.6f} | {kruskal_time:<15.6f}")
+        # Benchmark Kruskal over the parallel edge arrays
+        start_time = time.perf_counter()
+        g.kruskal_mst_fast()
+        kruskal_fast_time = time.perf_counter() - start_time
+        kruskal_fast_times.append(kruskal_fast_time)
+        
+        # Benchmark Borůvka with the minimum-edge search on a process pool
+        start_time = time.perf_counter()
+        g.boruvka_mst()
+        boruvka_time = time.perf_counter() - start_time
+        boruvka_times.append(boruvka_time)
+        
+        # Benchmark Filter-Kruskal
+        start_time = time.perf_counter()
+        g.kruskal_mst_filter()
+        filter_time = time.perf_counter() - start_time
+        filter_times.append(filter_time)
+        
+        print(f"{n:<10} | {prim_time:<15.6f} | {prim_auto_time:<15.6f} | {kruskal_time:<15.6f} | {kruskal_fast_time:<15.6f} | {boruvka_time:<15.6f} | {filter_time:<15.6f}")
 
     # Optional: Plotting (if environment supports it, otherwise just print)
     try:
+        import matplotlib
+        matplotlib.use('Agg') # Use non-interactive backend
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
         plt.plot(sizes, prim_times, label='Prim', marker='o')
+        plt.plot(sizes, prim_auto_times, label='Prim (auto)', marker='^')
         plt.plot(sizes, kruskal_times, label='Kruskal', marker='x')
+        plt.plot(sizes, kruskal_fast_times, label='Kruskal (fast)', marker='s')
+        plt.plot(sizes, boruvka_times, label='Borůvka', marker='d')
+        plt.plot(sizes, filter_times, label='Filter-Kruskal', marker='v')
         plt.xlabel('Number of Nodes')
         plt.ylabel('Execution Time (seconds)')
         plt.title('MST Algorithm Performance Comparison')
@@ -75,5 +108,39 @@ def benchmark():
     except Exception as e:
         print(f"\nCould not generate plot: {e}")
 
+def best_time(fn, repeats=3):
+    """Best wall time of fn() over a few runs."""
+    best = float('inf')
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+def density_sweep(sizes=(500, 1000, 2000), ratios=(0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45)):
+    """
+    Times prim_mst_indexed against prim_mst_dense over a range of E/V^2
+    ratios, the quantity prim_mst_auto compares with DENSE_PRIM_RATIO.
+    A simple graph tops out at E/V^2 just under 0.5.
+    """
+    print(f"{'Nodes':<10} | {'E/V^2':<10} | {'Indexed (s)':<15} | {'Dense (s)':<15} | {'Faster':<10}")
+    print("-" * 70)
+    for n in sizes:
+        crossover = None
+        for ratio in ratios:
+            g = generate_random_graph(n, density=2 * ratio)
+            real_ratio = len(g.edges) / (n * n)
+            indexed_time = best_time(g.prim_mst_indexed)
+            dense_time = best_time(g.prim_mst_dense)
+            faster = 'dense' if dense_time < indexed_time else 'indexed'
+            if faster == 'dense' and crossover is None:
+                crossover = real_ratio
+            print(f"{n:<10} | {real_ratio:<10.3f} | {indexed_time:<15.6f} | {dense_time:<15.6f} | {faster:<10}")
+        print(f"Dense first wins at E/V^2 = {crossover if crossover is None else round(crossover, 3)}")
+        print("-" * 70)
+
 if __name__ == "__main__":
-    benchmark()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        density_sweep()
+    else:
+        benchmark()
\ No newline at end of file
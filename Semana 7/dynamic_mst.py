@@ -0,0 +1,346 @@
+from mst import DSU
+
+class LinkCutTree:
+    """
+    Link-cut tree (Sleator-Tarjan) over a forest of nodes with values.
+    Supports link, cut, connectivity and "node with the largest value on the
+    path u-v" in O(log n) amortized time. Nodes are integer ids; the tree
+    lives in flat lists, with -1 as the null pointer.
+    """
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []   # Splay parent, or path-parent pointer for a splay root
+        self.flip = []     # Pending subtree reversal (from make_root)
+        self.value = []
+        self.best = []     # Node with the largest value in the splay subtree
+
+    def add_node(self, value):
+        """Adds an isolated node and returns its id."""
+        x = len(self.value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(x)
+        return x
+
+    def _is_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _pull(self, x):
+        value, best = self.value, self.best
+        b = x
+        child = self.left[x]
+        if child != -1 and value[best[child]] > value[b]:
+            b = best[child]
+        child = self.right[x]
+        if child != -1 and value[best[child]] > value[b]:
+            b = best[child]
+        best[x] = b
+
+    def _push(self, x):
+        if self.flip[x]:
+            self.flip[x] = False
+            l, r = self.left[x], self.right[x]
+            self.left[x], self.right[x] = r, l
+            if l != -1:
+                self.flip[l] = not self.flip[l]
+            if r != -1:
+                self.flip[r] = not self.flip[r]
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            b = right[x]
+            left[p] = b
+            right[x] = p
+        else:
+            b = left[x]
+            right[p] = b
+            left[x] = p
+        if b != -1:
+            parent[b] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x):
+        # Apply pending reversals from the splay root down to x first
+        path = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for y in reversed(path):
+            self._push(y)
+
+        parent, left = self.parent, self.left
+        while not self._is_root(x):
+            p = parent[x]
+            if not self._is_root(p):
+                g = parent[p]
+                if (left[g] == p) == (left[p] == x):
+                    self._rotate(p)  # zig-zig
+                else:
+                    self._rotate(x)  # zig-zag
+            self._rotate(x)
+
+    def _access(self, x):
+        """Makes the root-to-x path preferred; x ends as the root of its splay tree."""
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+
+    def find_root(self, x):
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] == -1:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, u, v):
+        return u == v or self.find_root(u) == self.find_root(v)
+
+    def link(self, u, v):
+        """Adds the tree edge u-v; u and v must be in different trees."""
+        self.make_root(u)
+        self.parent[u] = v
+
+    def cut(self, u, v):
+        """Removes the tree edge u-v."""
+        self.make_root(u)
+        self._access(v)
+        # u is now v's left child, with nothing between them
+        self.left[v] = -1
+        self.parent[u] = -1
+        self._pull(v)
+
+    def path_max(self, u, v):
+        """Node with the largest value on the path u-v (same tree)."""
+        self.make_root(u)
+        self._access(v)
+        return self.best[v]
+
+    def set_value(self, x, value):
+        self._access(x)
+        self.value[x] = value
+        self._pull(x)
+
+class DynamicMST:
+    """
+    Minimum spanning forest maintained under edge insertions, deletions and
+    weight changes, without recomputing from scratch.
+    Tree edges are kept in a link-cut tree, where each edge is a node whose
+    value is its weight (vertices have value -inf), so the heaviest edge on
+    any tree path is found in O(log n) amortized:
+    - inserting an edge, or lowering a non-tree edge, replaces the heaviest
+      edge on the cycle it closes if that edge is heavier;
+    - lowering a tree edge or raising a non-tree edge never changes the tree;
+    - raising or removing a tree edge cuts it and scans the non-tree edges
+      leaving the smaller of the two halves for the cheapest replacement.
+    """
+    def __init__(self, vertices):
+        self.V = vertices
+        self.lct = LinkCutTree()
+        for _ in range(vertices):
+            self.lct.add_node(float('-inf'))
+        self.edge_u = []
+        self.edge_v = []
+        self.edge_w = []
+        self.in_tree = []
+        self.removed = set()
+        self.tree_adj = [set() for _ in range(vertices)]      # Tree edge ids per vertex
+        self.non_tree_adj = [set() for _ in range(vertices)]  # Live non-tree edge ids per vertex
+        self.total_cost = 0
+
+    @classmethod
+    def from_network(cls, designer):
+        """
+        Builds the dynamic forest from the edges of a NetworkDesigner.
+        The initial forest comes from one Kruskal pass instead of inserting
+        the edges one by one into the link-cut tree.
+        """
+        dynamic = cls(designer.V)
+        for u, v, w in designer.edges:
+            dynamic._append_edge(u, v, w)
+        dsu = DSU(designer.V)
+        for e in sorted(range(len(dynamic.edge_w)), key=dynamic.edge_w.__getitem__):
+            if dsu.union(dynamic.edge_u[e], dynamic.edge_v[e]):
+                dynamic._link(e)
+            else:
+                dynamic._add_non_tree(e)
+        return dynamic
+
+    def _append_edge(self, u, v, w):
+        e = len(self.edge_u)
+        self.edge_u.append(u)
+        self.edge_v.append(v)
+        self.edge_w.append(w)
+        self.in_tree.append(False)
+        self.lct.add_node(w)
+        return e
+
+    def _node(self, edge_id):
+        return self.V + edge_id
+
+    def _add_non_tree(self, e):
+        u, v = self.edge_u[e], self.edge_v[e]
+        if u != v:  # Self-loops can never join the forest
+            self.non_tree_adj[u].add(e)
+            self.non_tree_adj[v].add(e)
+
+    def _discard_non_tree(self, e):
+        self.non_tree_adj[self.edge_u[e]].discard(e)
+        self.non_tree_adj[self.edge_v[e]].discard(e)
+
+    def _link(self, e):
+        u, v = self.edge_u[e], self.edge_v[e]
+        node = self._node(e)
+        self.lct.set_value(node, self.edge_w[e])
+        self.lct.link(u, node)
+        self.lct.link(node, v)
+        self.tree_adj[u].add(e)
+        self.tree_adj[v].add(e)
+        self.in_tree[e] = True
+        self.total_cost += self.edge_w[e]
+
+    def _cut(self, e):
+        u, v = self.edge_u[e], self.edge_v[e]
+        node = self._node(e)
+        self.lct.cut(u, node)
+        self.lct.cut(node, v)
+        self.tree_adj[u].discard(e)
+        self.tree_adj[v].discard(e)
+        self.in_tree[e] = False
+        self.total_cost -= self.edge_w[e]
+
+    def _offer(self, e):
+        """Puts non-tree edge e in the forest if it beats the heaviest edge on its cycle."""
+        u, v = self.edge_u[e], self.edge_v[e]
+        if u == v:
+            return
+        if not self.lct.connected(u, v):
+            self._discard_non_tree(e)
+            self._link(e)
+            return
+        heaviest = self.lct.path_max(u, v) - self.V
+        if self.edge_w[heaviest] > self.edge_w[e]:
+            self._cut(heaviest)
+            self._add_non_tree(heaviest)
+            self._discard_non_tree(e)
+            self._link(e)
+
+    def _walk(self, start, seen):
+        """Visits the tree containing start, one vertex per step."""
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            for e in self.tree_adj[x]:
+                y = self.edge_v[e] if self.edge_u[e] == x else self.edge_u[e]
+                if y not in seen:
+                    seen.add(y)
+                    stack.append(y)
+            yield True
+
+    def _smaller_side(self, u, v):
+        """Vertex set of the smaller of the trees of u and v, walking both in lockstep."""
+        side_u, side_v = {u}, {v}
+        walk_u, walk_v = self._walk(u, side_u), self._walk(v, side_v)
+        while True:
+            if not next(walk_u, False):
+                return side_u
+            if not next(walk_v, False):
+                return side_v
+
+    def _reconnect(self, u, v):
+        """After cutting the tree edge u-v, links the cheapest non-tree edge across the cut."""
+        side = self._smaller_side(u, v)
+        best = None
+        for x in side:
+            for e in self.non_tree_adj[x]:
+                if best is not None and self.edge_w[e] >= self.edge_w[best]:
+                    continue
+                if self.edge_u[e] not in side or self.edge_v[e] not in side:
+                    best = e
+        if best is not None:
+            self._discard_non_tree(best)
+            self._link(best)
+
+    def add_edge(self, u, v, w):
+        """
+        Adds an undirected edge and updates the forest.
+        Returns: the edge id, used by update_weight and remove_edge
+        """
+        e = self._append_edge(u, v, w)
+        self._add_non_tree(e)
+        self._offer(e)
+        return e
+
+    def update_weight(self, edge_id, w):
+        """Changes the weight of an edge and updates the forest."""
+        if edge_id in self.removed:
+            raise KeyError(edge_id)
+        old = self.edge_w[edge_id]
+        if not self.in_tree[edge_id]:
+            self.edge_w[edge_id] = w
+            self.lct.set_value(self._node(edge_id), w)
+            if w < old:
+                self._offer(edge_id)
+        elif w <= old:
+            self.total_cost += w - old
+            self.edge_w[edge_id] = w
+            self.lct.set_value(self._node(edge_id), w)
+        else:
+            # The edge itself competes with the replacements at its new weight
+            self._cut(edge_id)
+            self.edge_w[edge_id] = w
+            self.lct.set_value(self._node(edge_id), w)
+            self._add_non_tree(edge_id)
+            self._reconnect(self.edge_u[edge_id], self.edge_v[edge_id])
+
+    def remove_edge(self, edge_id):
+        """Removes an edge; if it was in the forest, the best replacement takes its place."""
+        if edge_id in self.removed:
+            raise KeyError(edge_id)
+        self.removed.add(edge_id)
+        if self.in_tree[edge_id]:
+            self._cut(edge_id)
+            self._reconnect(self.edge_u[edge_id], self.edge_v[edge_id])
+        else:
+            self._discard_non_tree(edge_id)
+
+    def connected(self, u, v):
+        return self.lct.connected(u, v)
+
+    def mst_edges(self):
+        """Current forest as a list of (u, v, w)."""
+        return [(self.edge_u[e], self.edge_v[e], self.edge_w[e])
+                for e in range(len(self.edge_u)) if self.in_tree[e]]
+
+    def mst(self):
+        """Returns: (mst_edges, total_cost), same as NetworkDesigner.kruskal_mst"""
+        return self.mst_edges(), self.total_cost
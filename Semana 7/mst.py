@@ -1,18 +1,40 @@
 import heapq
+import os
+import struct
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+
+# Edge/vertex^2 ratio above which prim_mst_auto uses the O(V^2) dense Prim.
+# From benchmark_mst.py sweep: the two break even around 0.35-0.4
+# (dense first wins at 0.35 for V=1000 and at 0.4 for V=2000)
+DENSE_PRIM_RATIO = 0.35
+
+# Part size below which kruskal_mst_filter stops partitioning and sorts
+FILTER_KRUSKAL_THRESHOLD = 2048
+
+# Binary record of an edge in the sorted runs of the external Kruskal
+EDGE_RECORD = struct.Struct('<dii')  # weight, u, v
 
 class DSU:
     """
     Disjoint Set Union (Union-Find) with Path Compression and Union by Rank.
     Optimized for Kruskal's algorithm.
+    Parents and ranks live in flat int arrays, and find is iterative, so long
+    chains cannot hit the recursion limit.
     """
     def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
+        self.parent = array('i', range(n))
+        self.rank = array('i', [0]) * n
 
     def find(self, i):
-        if self.parent[i] != i:
-            self.parent[i] = self.find(self.parent[i])  # Path compression
-        return self.parent[i]
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
 
     def union(self, i, j):
         root_i = self.find(i)
@@ -30,6 +52,111 @@ class DSU:
             return True
         return False
 
+class IndexedMinHeap:
+    """
+    Binary min-heap of vertices keyed by a priority, with decrease-key.
+    Each vertex appears at most once, so the heap never holds more than V
+    entries (the lazy heap in prim_mst can grow to E).
+    """
+    def __init__(self, n):
+        self.heap = []              # Vertices in heap order
+        self.key = [0] * n          # Priority of each vertex
+        self.pos = array('i', [-1]) * n  # Index in self.heap, -1 if absent
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, v):
+        return self.pos[v] != -1
+
+    def push_or_decrease(self, v, key):
+        """Inserts v, or lowers its key if it is already in the heap with a higher one."""
+        i = self.pos[v]
+        if i == -1:
+            i = len(self.heap)
+            self.heap.append(v)
+        elif key >= self.key[v]:
+            return
+        self.key[v] = key
+        self._sift_up(i, v)
+
+    def pop(self):
+        """Removes and returns (vertex, key) with the smallest key."""
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            self._sift_down(0, last)
+        return top, self.key[top]
+
+    def _sift_up(self, i, v):
+        heap, key, pos = self.heap, self.key, self.pos
+        k = key[v]
+        while i > 0:
+            parent = (i - 1) >> 1
+            p = heap[parent]
+            if key[p] <= k:
+                break
+            heap[i] = p
+            pos[p] = i
+            i = parent
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i, v):
+        heap, key, pos = self.heap, self.key, self.pos
+        k = key[v]
+        n = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            c = heap[child]
+            if k <= key[c]:
+                break
+            heap[i] = c
+            pos[c] = i
+            i = child
+        heap[i] = v
+        pos[v] = i
+
+# Edge columns of the graph being processed, set once per Borůvka worker
+_boruvka_edges = None
+
+def _init_boruvka_worker(edge_u, edge_v, edge_w):
+    global _boruvka_edges
+    _boruvka_edges = (edge_u, edge_v, edge_w)
+
+def _cheapest_in_chunk(task):
+    """
+    Cheapest outgoing edge of each component among a chunk of edge indices.
+    comp[v] is the component (DSU root) of vertex v. Ties on weight go to
+    the lower edge index, so every worker agrees on a single total order.
+    Edges inside a component can never be used again and are dropped.
+    Returns: ({component: edge_index}, surviving edge indices)
+    """
+    indices, comp = task
+    edge_u, edge_v, edge_w = _boruvka_edges
+    cheapest = {}
+    alive = array('i')
+    for i in indices:
+        cu = comp[edge_u[i]]
+        cv = comp[edge_v[i]]
+        if cu == cv:
+            continue
+        alive.append(i)
+        w = edge_w[i]
+        best = cheapest.get(cu)
+        if best is None or w < edge_w[best]:
+            cheapest[cu] = i
+        best = cheapest.get(cv)
+        if best is None or w < edge_w[best]:
+            cheapest[cv] = i
+    return cheapest, alive
+
 class NetworkDesigner:
     """
     Class to design networks using MST algorithms (Prim and Kruskal).
@@ -37,13 +164,21 @@ class NetworkDesigner:
     def __init__(self, vertices):
         self.V = vertices
         self.edges = []  # List of (u, v, w) for Kruskal
+        # Same edges as parallel columns, for the fast Kruskal path
+        self.edge_u = array('i')
+        self.edge_v = array('i')
+        self.edge_w = array('d')
         self.adj = {i: [] for i in range(vertices)}  # Adjacency list for Prim
+        self._dsu = None  # (DSU, edges merged, accepted edges) for connected(), built lazily
 
     def add_edge(self, u, v, w):
         """
         Adds an undirected edge to the graph.
         """
         self.edges.append((u, v, w))
+        self.edge_u.append(u)
+        self.edge_v.append(v)
+        self.edge_w.append(w)
         self.adj[u].append((v, w))
         self.adj[v].append((u, w))
 
@@ -87,6 +222,85 @@ class NetworkDesigner:
         # If nodes_in_mst < self.V, it's a Minimum Spanning Forest, but we return what we found for the component.
         return mst_edges, mst_cost
 
+    def prim_mst_indexed(self, start_node=0):
+        """
+        Prim's algorithm with an indexed heap and decrease-key.
+        The heap holds each vertex outside the tree once, keyed by its
+        cheapest known connection, so it stays O(V) instead of O(E).
+        Returns: (mst_edges, total_cost) for the component of start_node
+        """
+        if self.V == 0:
+            return [], 0
+
+        in_tree = bytearray(self.V)
+        link = array('i', [-1]) * self.V  # Tree endpoint of each vertex's best edge
+        pq = IndexedMinHeap(self.V)
+        pq.push_or_decrease(start_node, 0)
+        pos, key = pq.pos, pq.key
+
+        mst_edges = []
+        mst_cost = 0
+        while pq:
+            v, weight = pq.pop()
+            in_tree[v] = 1
+            if link[v] != -1:
+                mst_edges.append((link[v], v, weight))
+                mst_cost += weight
+            for next_node, next_weight in self.adj[v]:
+                # Checked here so most edges never pay for a method call
+                if not in_tree[next_node] and (pos[next_node] == -1 or next_weight < key[next_node]):
+                    pq.push_or_decrease(next_node, next_weight)
+                    link[next_node] = v
+
+        return mst_edges, mst_cost
+
+    def prim_mst_dense(self, start_node=0):
+        """
+        O(V^2) Prim's algorithm for dense graphs, with no heap at all.
+        Keeps the cheapest connection of every vertex in a flat list and picks
+        the next vertex with a linear min() scan, which is cheaper than heap
+        operations once E is close to V^2.
+        Returns: (mst_edges, total_cost) for the component of start_node
+        """
+        if self.V == 0:
+            return [], 0
+
+        INF = float('inf')
+        best = [INF] * self.V  # INF also marks vertices already in the tree
+        link = array('i', [-1]) * self.V
+        in_tree = bytearray(self.V)
+        best[start_node] = 0
+
+        mst_edges = []
+        mst_cost = 0
+        for _ in range(self.V):
+            weight = min(best)
+            if weight == INF:
+                break  # The rest is unreachable from start_node
+            v = best.index(weight)
+            best[v] = INF
+            in_tree[v] = 1
+            if link[v] != -1:
+                mst_edges.append((link[v], v, weight))
+                mst_cost += weight
+            for next_node, next_weight in self.adj[v]:
+                if not in_tree[next_node] and next_weight < best[next_node]:
+                    best[next_node] = next_weight
+                    link[next_node] = v
+
+        return mst_edges, mst_cost
+
+    def prim_mst_auto(self, start_node=0):
+        """
+        Prim's algorithm choosing the implementation by graph density:
+        the O(V^2) array version when E >= DENSE_PRIM_RATIO * V^2,
+        otherwise the indexed-heap version.
+        Returns: (mst_edges, total_cost)
+        """
+        if len(self.edges) >= DENSE_PRIM_RATIO * self.V * self.V:
+            return self.prim_mst_dense(start_node)
+        return self.prim_mst_indexed(start_node)
+
     def kruskal_mst(self):
         """
         Implements Kruskal's algorithm to find the MST.
@@ -106,8 +320,420 @@ class NetworkDesigner:
 
         return mst_edges, mst_cost
 
+    def kruskal_mst_fast(self):
+        """
+        Kruskal's algorithm over the parallel edge columns.
+        Edge indices are sorted by weight (an argsort keyed on the weight
+        array, with no per-edge tuples or lambdas), the DSU is inlined with
+        path halving and union by rank, and the scan stops as soon as V-1
+        edges have been accepted.
+        Returns: (mst_edges, total_cost), same as kruskal_mst
+        """
+        _, accepted = self._kruskal_fast_indices()
+
+        # Report the edges as they were added (keeps int weights as ints)
+        mst_edges = [self.edges[i] for i in accepted]
+        return mst_edges, sum(w for _, _, w in mst_edges)
+
+    def _kruskal_fast_indices(self):
+        """Kruskal over the edge columns. Returns: (dsu, accepted edge indices)"""
+        order = sorted(range(len(self.edge_u)), key=self.edge_w.__getitem__)
+        dsu = DSU(self.V)
+        accepted = []
+        self._kruskal_scan(order, dsu, accepted)
+        return dsu, accepted
+
+    def _kruskal_scan(self, order, dsu, accepted):
+        """
+        Kruskal's main loop over edge indices already sorted by weight, with
+        the DSU inlined. Appends accepted edge indices to `accepted` and
+        returns True once the tree is complete (V-1 edges).
+        """
+        edge_u, edge_v = self.edge_u, self.edge_v
+        parent, rank = dsu.parent, dsu.rank
+        needed = self.V - 1
+        if len(accepted) >= needed:
+            return True
+        for i in order:
+            ru = edge_u[i]
+            while parent[ru] != ru:
+                parent[ru] = parent[parent[ru]]
+                ru = parent[ru]
+            rv = edge_v[i]
+            while parent[rv] != rv:
+                parent[rv] = parent[parent[rv]]
+                rv = parent[rv]
+            if ru == rv:
+                continue
+            if rank[ru] < rank[rv]:
+                parent[ru] = rv
+            elif rank[ru] > rank[rv]:
+                parent[rv] = ru
+            else:
+                parent[rv] = ru
+                rank[ru] += 1
+            accepted.append(i)
+            if len(accepted) == needed:
+                return True
+        return False
+
+    def kruskal_mst_filter(self, threshold=FILTER_KRUSKAL_THRESHOLD):
+        """
+        Filter-Kruskal (Osipov, Sanders, Singler).
+        Edges are partitioned around a pivot weight. The light part is solved
+        first; the heavy part is then filtered against the DSU, dropping every
+        edge that already closes a cycle, before it is partitioned and sorted
+        in turn. On graphs with many more edges than vertices most heavy
+        edges are discarded without ever being sorted. Parts of at most
+        `threshold` edges are sorted directly.
+        Returns: (mst_edges, total_cost), same as kruskal_mst
+        """
+        edge_u, edge_v, edge_w = self.edge_u, self.edge_v, self.edge_w
+        dsu = DSU(self.V)
+        find = dsu.find
+        accepted = []
+        # Stack of (edge indices, must be filtered, all of one weight); lightest part on top
+        pending = [(list(range(len(edge_u))), False, False)]
+        while pending:
+            edges, needs_filter, single_weight = pending.pop()
+            if needs_filter:
+                edges = [i for i in edges if find(edge_u[i]) != find(edge_v[i])]
+            if single_weight or len(edges) <= threshold:
+                if not single_weight:
+                    edges.sort(key=edge_w.__getitem__)
+                if self._kruskal_scan(edges, dsu, accepted):
+                    break
+                continue
+            # Median of a few sampled weights as pivot
+            step = len(edges) // 9
+            pivot = sorted(edge_w[edges[k * step]] for k in range(9))[4]
+            light = [i for i in edges if edge_w[i] < pivot]
+            equal = [i for i in edges if edge_w[i] == pivot]
+            heavy = [i for i in edges if edge_w[i] > pivot]
+            pending.append((heavy, True, False))
+            pending.append((equal, True, True))
+            pending.append((light, False, False))
+
+        mst_edges = [self.edges[i] for i in accepted]
+        return mst_edges, sum(w for _, _, w in mst_edges)
+
+    def boruvka_mst(self, processes=None, chunks=None):
+        """
+        Implements Borůvka's algorithm to find the MST (or forest).
+        Each round finds the cheapest outgoing edge of every component and
+        merges them all through the DSU, so there are at most log2(V) rounds.
+        The minimum-edge search is split into chunks of the edge columns
+        and run on a process pool (processes=1 runs it in this process).
+        Returns: (mst_edges, total_cost), same as kruskal_mst
+        """
+        processes = processes or os.cpu_count() or 1
+        m = len(self.edge_u)
+        chunks = chunks or processes
+        size = max(1, -(-m // chunks))
+        chunk_list = [array('i', range(start, min(start + size, m))) for start in range(0, m, size)]
+
+        columns = (self.edge_u, self.edge_v, self.edge_w)
+        if processes == 1:
+            _init_boruvka_worker(*columns)
+            return self._boruvka_rounds(chunk_list, map)
+        # The edge columns are sent once per worker; tasks carry only indices and comp
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_boruvka_worker,
+                                 initargs=columns) as executor:
+            return self._boruvka_rounds(chunk_list, executor.map)
+
+    def _boruvka_rounds(self, chunk_list, mapper):
+        edge_u, edge_v, edge_w = self.edge_u, self.edge_v, self.edge_w
+        dsu = DSU(self.V)
+        accepted = []
+        while True:
+            comp = array('i', map(dsu.find, range(self.V)))
+            cheapest = {}
+            results = list(mapper(_cheapest_in_chunk, [(indices, comp) for indices in chunk_list]))
+            chunk_list = [alive for _, alive in results if alive]
+            for partial, _ in results:
+                for c, i in partial.items():
+                    j = cheapest.get(c)
+                    if j is None or (edge_w[i], i) < (edge_w[j], j):
+                        cheapest[c] = i
+            if not cheapest:
+                break  # Every remaining component has no outgoing edges
+            for i in set(cheapest.values()):
+                if dsu.union(edge_u[i], edge_v[i]):
+                    accepted.append(i)
+
+        mst_edges = [self.edges[i] for i in accepted]
+        return mst_edges, sum(w for _, _, w in mst_edges)
+
+    def _components(self):
+        """
+        DSU of the connected components. It is built on the first query and
+        afterwards only merges the edges added since, so add_edge stays free
+        of any DSU work.
+        """
+        if self._dsu is None:
+            self._dsu = (DSU(self.V), 0, [])
+        dsu, merged, accepted = self._dsu
+        m = len(self.edge_u)
+        if merged < m:
+            self._kruskal_scan(range(merged, m), dsu, accepted)
+            self._dsu = (dsu, m, accepted)
+        return dsu
+
+    def connected(self, u, v):
+        """
+        True if u and v are in the same component of the graph.
+        Answered from a retained DSU in O(α(n)), without any traversal.
+        """
+        dsu = self._components()
+        return dsu.find(u) == dsu.find(v)
+
+    conectados = connected
+
+    def minimum_spanning_forest(self):
+        """
+        Minimum spanning forest broken down by connected component.
+        Unlike prim_mst (start node's component only) and kruskal_mst (one
+        flat edge list), every component is reported, isolated vertices
+        included, ordered by their smallest vertex.
+        Returns: list of (vertices, mst_edges, total_cost), one per component
+        """
+        dsu, accepted = self._kruskal_fast_indices()
+        # Kruskal's DSU already holds the components: keep it for connected()
+        self._dsu = (dsu, len(self.edge_u), list(accepted))
+        mst_edges = [self.edges[i] for i in accepted]
+        find = dsu.find
+        position = {}  # Component root -> index in forest
+        forest = []
+        for v in range(self.V):
+            root = find(v)
+            k = position.get(root)
+            if k is None:
+                position[root] = len(forest)
+                forest.append(([v], [], [0]))
+            else:
+                forest[k][0].append(v)
+        for u, v, w in mst_edges:
+            _, edges, cost = forest[position[find(u)]]
+            edges.append((u, v, w))
+            cost[0] += w
+        return [(vertices, edges, cost[0]) for vertices, edges, cost in forest]
+
     def get_total_connection_cost(self):
         """
         Calculates the cost if all edges were used (fully connected based on available edges).
         """
-        return sum(w for u, v, w in self.edges)
\ No newline at end of file
+        return sum(w for u, v, w in self.edges)
+
+def write_edge_file(path, edges):
+    """Writes (u, v, w) edges as a text edge list, one "u v w" per line."""
+    with open(path, 'w') as f:
+        for u, v, w in edges:
+            f.write(f"{u} {v} {w}\n")
+
+def read_edge_file(path):
+    """Streams (u, v, w) from a text edge list; blank lines and '#' comments are skipped."""
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith('#'):
+                continue
+            yield int(parts[0]), int(parts[1]), float(parts[2])
+
+def _write_run(records, tmp_dir):
+    """Writes (w, u, v) records, already sorted, to a temporary file rewound for reading."""
+    run = tempfile.TemporaryFile(dir=tmp_dir)
+    batch = []
+    for record in records:
+        batch.append(EDGE_RECORD.pack(*record))
+        if len(batch) == 65536:
+            run.write(b''.join(batch))
+            batch.clear()
+    run.write(b''.join(batch))
+    run.seek(0)
+    return run
+
+def _read_run(run, block_records=65536):
+    while True:
+        block = run.read(EDGE_RECORD.size * block_records)
+        if not block:
+            return
+        yield from EDGE_RECORD.iter_unpack(block)
+
+def _merge_runs(runs, tmp_dir):
+    """Merges sorted runs into a single new run and closes (deletes) the inputs."""
+    merged = _write_run(heapq.merge(*map(_read_run, runs), key=itemgetter(0)), tmp_dir)
+    for run in runs:
+        run.close()
+    return merged
+
+def _sorted_runs(edges, chunk_edges, max_open_runs, tmp_dir):
+    """
+    Phase 1 of the external sort: cuts the edge stream into chunks of
+    chunk_edges, sorts each one by weight in memory and writes it as a run.
+    Runs are merged level by level with a fan-in of max_open_runs: once a
+    level holds max_open_runs runs they become one run of the next level,
+    so every edge is rewritten O(log(runs) / log(max_open_runs)) times.
+    Returns at most max_open_runs runs for the final merge.
+    """
+    if max_open_runs < 2:
+        raise ValueError("max_open_runs must be at least 2")
+    levels = [[]]  # levels[i]: runs that have gone through i merges
+    while True:
+        chunk = [(w, u, v) for u, v, w in islice(edges, chunk_edges)]
+        if not chunk:
+            break
+        chunk.sort(key=itemgetter(0))
+        levels[0].append(_write_run(chunk, tmp_dir))
+        i = 0
+        while len(levels[i]) == max_open_runs:
+            if i + 1 == len(levels):
+                levels.append([])
+            levels[i + 1].append(_merge_runs(levels[i], tmp_dir))
+            levels[i] = []
+            i += 1
+
+    # Leftovers of every level, smallest first; merge the smallest until the rest fit
+    runs = [run for level in levels for run in level]
+    while len(runs) > max_open_runs:
+        runs = [_merge_runs(runs[:max_open_runs], tmp_dir)] + runs[max_open_runs:]
+    return runs
+
+def kruskal_mst_external(path, vertices, chunk_edges=500000, max_open_runs=256, tmp_dir=None):
+    """
+    Kruskal's algorithm for edge lists larger than memory.
+    Edges are read from a text file (see read_edge_file) and sorted with an
+    external merge sort: sorted runs of chunk_edges edges go to temporary
+    files and are then merged with heapq.merge while streaming into the DSU.
+    Only the DSU (O(V)), one chunk and the MST itself are kept in memory.
+    Reading stops once V-1 edges have been accepted.
+    Returns: (mst_edges, total_cost), with weights as floats
+    """
+    runs = _sorted_runs(read_edge_file(path), chunk_edges, max_open_runs, tmp_dir)
+    try:
+        dsu = DSU(vertices)
+        mst_edges = []
+        mst_cost = 0
+        needed = vertices - 1
+        for w, u, v in heapq.merge(*map(_read_run, runs), key=itemgetter(0)):
+            if dsu.union(u, v):
+                mst_edges.append((u, v, w))
+                mst_cost += w
+                if len(mst_edges) == needed:
+                    break
+        return mst_edges, mst_cost
+    finally:
+        for run in runs:
+            run.close()
+
+class _EdgeView:
+    """Read-only sequence of (u, v, w) tuples built on demand from the edge columns."""
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __len__(self):
+        return len(self.graph.edge_u)
+
+    def __getitem__(self, i):
+        g = self.graph
+        return g.edge_u[i], g.edge_v[i], g.edge_w[i]
+
+    def __iter__(self):
+        g = self.graph
+        return zip(g.edge_u, g.edge_v, g.edge_w)
+
+class _CSRAdjacency:
+    """adj[v] over a CSR layout: yields (neighbor, weight) like the dict of lists."""
+    def __init__(self, offsets, targets, weights):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, v):
+        start, end = self.offsets[v], self.offsets[v + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+class CompactNetworkDesigner(NetworkDesigner):
+    """
+    NetworkDesigner backed only by flat arrays, for graphs with millions of edges.
+    Edges are kept as three columns (int32 u, int32 v and float64 or float32
+    weights: 16 or 12 bytes per edge instead of ~200 for the tuples, lists
+    and dict entries of NetworkDesigner). The adjacency needed by Prim is
+    built on demand as CSR (compressed sparse row) arrays. All the MST
+    methods of NetworkDesigner work unchanged; edges are reported with the
+    weights as stored in the weight column.
+    """
+    def __init__(self, vertices, weight_type='d'):
+        self.V = vertices
+        self.edge_u = array('i')
+        self.edge_v = array('i')
+        self.edge_w = array(weight_type)  # 'd' for float64, 'f' for float32
+        self.edges = _EdgeView(self)
+        self._adj = None
+        self._dsu = None
+
+    def add_edge(self, u, v, w):
+        """
+        Adds an undirected edge to the graph.
+        """
+        self.edge_u.append(u)
+        self.edge_v.append(v)
+        self.edge_w.append(w)
+        self._adj = None
+
+    def add_edges(self, us, vs, ws):
+        """
+        Adds many undirected edges at once from three equal-length sequences
+        (arrays, lists or any iterables), without building a tuple per edge.
+        """
+        us, vs, ws = array('i', us), array('i', vs), array(self.edge_w.typecode, ws)
+        if not len(us) == len(vs) == len(ws):
+            raise ValueError("us, vs and ws must have the same length")
+        self.edge_u.extend(us)
+        self.edge_v.extend(vs)
+        self.edge_w.extend(ws)
+        self._adj = None
+
+    @property
+    def adj(self):
+        if self._adj is None:
+            self._adj = _CSRAdjacency(*self.build_csr())
+        return self._adj
+
+    def build_csr(self):
+        """
+        Builds the CSR adjacency: the neighbors of v are targets[offsets[v]:offsets[v + 1]],
+        with matching weights. Each edge is stored once per direction.
+        Returns: (offsets, targets, weights)
+        """
+        edge_u, edge_v, edge_w = self.edge_u, self.edge_v, self.edge_w
+        offsets = array('q', [0]) * (self.V + 1)
+        for u in edge_u:
+            offsets[u + 1] += 1
+        for v in edge_v:
+            offsets[v + 1] += 1
+        for i in range(self.V):
+            offsets[i + 1] += offsets[i]
+
+        targets = array('i', [0]) * (2 * len(edge_u))
+        weights = array(edge_w.typecode, [0]) * (2 * len(edge_u))
+        fill = array('q', offsets)  # Next free slot of each vertex
+        for u, v, w in zip(edge_u, edge_v, edge_w):
+            i = fill[u]
+            targets[i] = v
+            weights[i] = w
+            fill[u] = i + 1
+            i = fill[v]
+            targets[i] = u
+            weights[i] = w
+            fill[v] = i + 1
+        return offsets, targets, weights
+
+    def memory_bytes(self):
+        """Bytes used by the edge columns plus the CSR arrays, if built."""
+        total = sum(col.itemsize * len(col) for col in (self.edge_u, self.edge_v, self.edge_w))
+        if self._adj is not None:
+            total += sum(col.itemsize * len(col) for col in (self._adj.offsets, self._adj.targets, self._adj.weights))
+        return total
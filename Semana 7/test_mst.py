@@ -1,5 +1,11 @@
+import os
+import random
+import tempfile
 import unittest
-from mst import NetworkDesigner
+from array import array
+from mst import (DSU, CompactNetworkDesigner, IndexedMinHeap, NetworkDesigner,
+                 kruskal_mst_external, write_edge_file)
+from dynamic_mst import DynamicMST
 
 class TestMSTAlgorithms(unittest.TestCase):
 
@@ -111,5 +117,248 @@ class TestMSTAlgorithms(unittest.TestCase):
         self.assertEqual(cost_prim, 37)
         self.assertEqual(cost_kruskal, 37)
 
+    def test_kruskal_fast_matches(self):
+        """Case 6: Fast Kruskal gives the same cost as the tuple-based version"""
+        rnd = random.Random(42)
+        for n in (1, 2, 10, 60):
+            g = NetworkDesigner(n)
+            for _ in range(n * 4):
+                u, v = rnd.randrange(n), rnd.randrange(n)
+                if u != v:
+                    g.add_edge(u, v, rnd.randint(1, 20))
+            edges, cost = g.kruskal_mst()
+            fast_edges, fast_cost = g.kruskal_mst_fast()
+            self.assertEqual(fast_cost, cost)
+            self.assertEqual(len(fast_edges), len(edges))
+
+        g = NetworkDesigner(3)
+        g.add_edge(0, 1, 2.5)
+        g.add_edge(1, 2, 0.5)
+        g.add_edge(0, 2, 1.0)
+        self.assertEqual(g.kruskal_mst_fast(), ([(1, 2, 0.5), (0, 2, 1.0)], 1.5))
+
+    def test_dsu_long_chain(self):
+        """Case 7: DSU.find is iterative and handles very long parent chains"""
+        n = 100000
+        dsu = DSU(n)
+        for i in range(n - 1):
+            dsu.parent[i] = i + 1  # Worst case chain, no union by rank
+        self.assertEqual(dsu.find(0), n - 1)
+        self.assertEqual(dsu.parent[0], 2)  # Path halving skipped a level
+        self.assertFalse(dsu.union(0, n - 1))
+
+    def test_prim_variants(self):
+        """Case 8: Indexed-heap, dense and automatic Prim agree with lazy Prim"""
+        rnd = random.Random(5)
+        for n, edge_count in ((1, 0), (8, 6), (40, 60), (40, 700)):
+            g = NetworkDesigner(n)
+            for _ in range(edge_count):
+                u, v = rnd.randrange(n), rnd.randrange(n)
+                if u != v:
+                    g.add_edge(u, v, rnd.randint(1, 30))
+            _, cost = g.prim_mst()
+            for variant in (g.prim_mst_indexed, g.prim_mst_dense, g.prim_mst_auto):
+                edges, variant_cost = variant()
+                self.assertEqual(variant_cost, cost)
+                self.assertEqual(sum(w for _, _, w in edges), cost)
+
+        # Disconnected: only the component of start_node, like prim_mst
+        g = NetworkDesigner(4)
+        g.add_edge(0, 1, 5)
+        g.add_edge(2, 3, 10)
+        self.assertEqual(g.prim_mst_indexed(2), ([(2, 3, 10)], 10))
+        self.assertEqual(g.prim_mst_dense(0), ([(0, 1, 5)], 5))
+
+    def test_indexed_heap(self):
+        """Case 9: IndexedMinHeap keeps one entry per vertex and supports decrease-key"""
+        heap = IndexedMinHeap(5)
+        for v, key in ((0, 9), (1, 4), (2, 7), (3, 8)):
+            heap.push_or_decrease(v, key)
+        heap.push_or_decrease(0, 1)
+        heap.push_or_decrease(2, 10)  # Not a decrease, ignored
+        self.assertEqual(len(heap), 4)
+        self.assertNotIn(4, heap)
+        self.assertEqual([heap.pop() for _ in range(4)], [(0, 1), (1, 4), (2, 7), (3, 8)])
+        self.assertNotIn(0, heap)
+
+    def test_boruvka(self):
+        """Case 10: Borůvka matches Kruskal, sequentially and on a process pool"""
+        rnd = random.Random(9)
+        g = NetworkDesigner(50)
+        for _ in range(300):
+            u, v = rnd.randrange(50), rnd.randrange(50)
+            if u != v:
+                g.add_edge(u, v, rnd.randint(1, 10))  # Many ties on purpose
+        _, cost = g.kruskal_mst()
+        for processes, chunks in ((1, None), (1, 7), (2, 3)):
+            edges, boruvka_cost = g.boruvka_mst(processes=processes, chunks=chunks)
+            self.assertEqual(boruvka_cost, cost)
+            self.assertEqual(len(edges), 49)
+
+        # Forest: one tree per component
+        g = NetworkDesigner(5)
+        g.add_edge(0, 1, 5)
+        g.add_edge(2, 3, 10)
+        self.assertEqual(g.boruvka_mst(processes=1)[1], 15)
+        self.assertEqual(NetworkDesigner(3).boruvka_mst(processes=1), ([], 0))
+
+    def test_compact_backend(self):
+        """Case 11: The array/CSR backend gives the same MSTs with far less memory"""
+        rnd = random.Random(3)
+        n = 60
+        us, vs, ws = [], [], []
+        for _ in range(400):
+            u, v = rnd.randrange(n), rnd.randrange(n)
+            if u != v:
+                us.append(u)
+                vs.append(v)
+                ws.append(rnd.randint(1, 50))
+        g = NetworkDesigner(n)
+        for u, v, w in zip(us, vs, ws):
+            g.add_edge(u, v, w)
+        compact = CompactNetworkDesigner(n)
+        compact.add_edges(array('i', us), vs, ws)
+        _, cost = g.kruskal_mst()
+        for method in ("prim_mst", "prim_mst_indexed", "prim_mst_dense", "kruskal_mst",
+                       "kruskal_mst_fast"):
+            self.assertEqual(getattr(compact, method)()[1], cost)
+        self.assertEqual(compact.boruvka_mst(processes=1)[1], cost)
+        self.assertEqual(compact.get_total_connection_cost(), g.get_total_connection_cost())
+
+        offsets, targets, weights = compact.build_csr()
+        self.assertEqual(offsets[-1], 2 * len(us))
+        self.assertEqual(sorted(zip(targets[offsets[5]:offsets[6]], weights[offsets[5]:offsets[6]])),
+                         sorted(g.adj[5]))
+
+        compact.add_edge(0, n - 1, 0.5)  # Invalidates the CSR
+        self.assertIn((n - 1, 0.5), list(compact.adj[0]))
+        small = CompactNetworkDesigner(n, weight_type='f')
+        small.add_edges(us, vs, ws)
+        self.assertEqual(small.memory_bytes(), 12 * len(us))
+        with self.assertRaises(ValueError):
+            small.add_edges([0, 1], [1], [1.0, 2.0])
+
+    def test_dynamic_mst(self):
+        """Case 12: DynamicMST matches a Kruskal recomputation after every change"""
+        rnd = random.Random(17)
+        n = 15
+        g = NetworkDesigner(n)
+        for _ in range(25):
+            g.add_edge(rnd.randrange(n), rnd.randrange(n), rnd.randint(1, 30))
+        dynamic = DynamicMST.from_network(g)
+        live = {e: edge for e, edge in enumerate(g.edges)}
+
+        for step in range(300):
+            op = rnd.random()
+            if op < 0.3:
+                u, v, w = rnd.randrange(n), rnd.randrange(n), rnd.randint(1, 30)
+                live[dynamic.add_edge(u, v, w)] = (u, v, w)
+            elif op < 0.85:
+                e = rnd.choice(list(live))
+                u, v, _ = live[e]
+                w = rnd.randint(1, 30)
+                dynamic.update_weight(e, w)
+                live[e] = (u, v, w)
+            else:
+                e = rnd.choice(list(live))
+                dynamic.remove_edge(e)
+                del live[e]
+
+            expected = NetworkDesigner(n)
+            for u, v, w in live.values():
+                if u != v:
+                    expected.add_edge(u, v, w)
+            expected_edges, expected_cost = expected.kruskal_mst()
+            edges, cost = dynamic.mst()
+            self.assertEqual(cost, expected_cost)
+            self.assertEqual(len(edges), len(expected_edges))
+            self.assertEqual(sum(w for _, _, w in edges), cost)
+
+        e = next(iter(live))
+        dynamic.remove_edge(e)
+        with self.assertRaises(KeyError):
+            dynamic.update_weight(e, 1)
+
+    def test_kruskal_external(self):
+        """Case 13: External Kruskal over an edge file matches in-memory Kruskal"""
+        rnd = random.Random(23)
+        n = 80
+        g = NetworkDesigner(n)
+        for _ in range(600):
+            u, v = rnd.randrange(n), rnd.randrange(n)
+            if u != v:
+                g.add_edge(u, v, rnd.randint(1, 40))
+        edges, cost = g.kruskal_mst()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "edges.txt")
+            write_edge_file(path, g.edges)
+            # One run in memory, many runs, and runs merged over several levels
+            for chunk_edges, max_open_runs in ((10000, 256), (37, 256), (11, 3), (11, 2), (5, 4)):
+                ext_edges, ext_cost = kruskal_mst_external(path, n, chunk_edges, max_open_runs, tmp_dir)
+                self.assertEqual(ext_cost, cost)
+                self.assertEqual(len(ext_edges), len(edges))
+                self.assertEqual([w for _, _, w in ext_edges], [w for _, _, w in edges])
+            self.assertEqual(os.listdir(tmp_dir), ["edges.txt"])
+            with self.assertRaises(ValueError):
+                kruskal_mst_external(path, n, 11, 1, tmp_dir)
+
+    def test_kruskal_filter(self):
+        """Case 14: Filter-Kruskal matches Kruskal, including heavy ties and forests"""
+        rnd = random.Random(31)
+        for n, edge_count, max_weight in ((200, 3000, 1000), (200, 3000, 3), (300, 200, 50)):
+            g = NetworkDesigner(n)
+            for _ in range(edge_count):
+                u, v = rnd.randrange(n), rnd.randrange(n)
+                if u != v:
+                    g.add_edge(u, v, rnd.randint(1, max_weight))
+            edges, cost = g.kruskal_mst()
+            for threshold in (16, 2048):
+                filter_edges, filter_cost = g.kruskal_mst_filter(threshold)
+                self.assertEqual(filter_cost, cost)
+                self.assertEqual(len(filter_edges), len(edges))
+
+        g = NetworkDesigner(50)
+        for i in range(49):
+            g.add_edge(i, i + 1, 7)  # A single weight: one "equal" part
+        for _ in range(100):
+            g.add_edge(rnd.randrange(50), rnd.randrange(50), 7)
+        self.assertEqual(g.kruskal_mst_filter(threshold=4)[1], 49 * 7)
+
+    def test_spanning_forest(self):
+        """Case 15: Per-component forest and connectivity from the lazily built DSU"""
+        g = NetworkDesigner(7)
+        g.add_edge(0, 1, 5)
+        g.add_edge(1, 2, 3)
+        g.add_edge(0, 2, 4)
+        g.add_edge(4, 5, 10)
+        # Vertices 3 and 6 are isolated
+        forest = g.minimum_spanning_forest()
+        self.assertEqual([vertices for vertices, _, _ in forest], [[0, 1, 2], [3], [4, 5], [6]])
+        self.assertEqual([cost for _, _, cost in forest], [7, 0, 10, 0])
+        self.assertEqual(sorted(forest[0][1]), [(0, 2, 4), (1, 2, 3)])
+        self.assertEqual(sum(cost for _, _, cost in forest), g.kruskal_mst()[1])
+
+        self.assertTrue(g.connected(0, 2))
+        self.assertFalse(g.conectados(2, 4))
+        self.assertTrue(g.connected(3, 3))
+        g.add_edge(2, 4, 1)
+        self.assertTrue(g.conectados(0, 5))
+        self.assertEqual(len(g.minimum_spanning_forest()), 3)
+
+        compact = CompactNetworkDesigner(4)
+        compact.add_edges([0], [1], [2.0])
+        compact.add_edge(2, 3, 1.0)
+        self.assertFalse(compact.connected(1, 2))
+        self.assertEqual([(v, c) for v, _, c in compact.minimum_spanning_forest()], [([0, 1], 2.0), ([2, 3], 1.0)])
+        compact.add_edges([1], [3], [5.0])
+        self.assertTrue(compact.connected(0, 2))
+
+        lazy = NetworkDesigner(3)
+        lazy.add_edge(0, 1, 1)
+        self.assertFalse(lazy.connected(0, 2))
+        lazy.add_edge(1, 2, 1)
+        self.assertTrue(lazy.connected(0, 2))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+from bisect import bisect_left
+
+class ArregloOrdenado:
+    """
+    Índice sobre dos listas paralelas ordenadas (palabras y posiciones).
+    La búsqueda es binaria con bisect; insertar una palabra nueva desplaza
+    los elementos siguientes (O(n)), pero en memoria contigua.
+    Misma interfaz que BST/AVL.
+    """
+
+    def __init__(self):
+        self.palabras = []
+        self.posiciones = []
+
+    def insertar(self, palabra, linea, columna):
+        """Inserta una palabra o agrega una nueva posición si ya existe."""
+        i = bisect_left(self.palabras, palabra)
+        if i < len(self.palabras) and self.palabras[i] == palabra:
+            self.posiciones[i].append((linea, columna))
+        else:
+            self.palabras.insert(i, palabra)
+            self.posiciones.insert(i, [(linea, columna)])
+
+    def buscar(self, palabra):
+        """Busca una palabra y retorna sus posiciones o None."""
+        i = bisect_left(self.palabras, palabra)
+        if i < len(self.palabras) and self.palabras[i] == palabra:
+            return self.posiciones[i]
+        return None
+
+    def eliminar(self, palabra):
+        """Elimina una palabra del índice."""
+        i = bisect_left(self.palabras, palabra)
+        if i < len(self.palabras) and self.palabras[i] == palabra:
+            del self.palabras[i]
+            del self.posiciones[i]
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+    def __iter__(self):
+        return zip(self.palabras, self.posiciones)
+
+if __name__ == "__main__":
+    indice = ArregloOrdenado()
+    palabras = ["perro", "gato", "casa", "arbol", "zorro", "perro"]
+    for i, p in enumerate(palabras):
+        indice.insertar(p, 1, i + 1)
+    indice.eliminar("casa")
+    print("Inorden:", indice.inorden())
@@ -1,10 +1,26 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from posiciones import Posiciones
+
+# Formato de guardado: cabecera, largos de palabra, cantidad de posiciones por
+# palabra, palabras en UTF-8 concatenadas y los pares (linea, columna)
+# intercalados como en Posiciones.pares (little-endian).
+MAGIA_AVL = b"AVL2"
+CABECERA_AVL = struct.Struct("<4sII")  # magia, num_palabras, num_posiciones
+
 class NodoAVL:
+    __slots__ = ("palabra", "posiciones", "izquierdo", "derecho", "altura", "tamano", "total")
+
     def __init__(self, palabra, linea, columna):
         self.palabra = palabra
-        self.posiciones = [(linea, columna)]
+        self.posiciones = Posiciones.de_par(linea, columna)  # Pares (linea, columna) en un array
         self.izquierdo = None
         self.derecho = None
         self.altura = 1
+        self.tamano = 1  # Palabras distintas en el subárbol
+        self.total = 1   # Ocurrencias (posiciones) en el subárbol
 
 class AVL:
     """
@@ -23,8 +39,18 @@ class AVL:
             return 0
         return self.altura(nodo.izquierdo) - self.altura(nodo.derecho)
     
+    def tamano(self, nodo):
+        return nodo.tamano if nodo else 0
+
+    def total(self, nodo):
+        return nodo.total if nodo else 0
+
     def actualizar_altura(self, nodo):
+        # Además de la altura se recalculan los aumentos de estadística de orden
         nodo.altura = 1 + max(self.altura(nodo.izquierdo), self.altura(nodo.derecho))
+        nodo.tamano = 1 + self.tamano(nodo.izquierdo) + self.tamano(nodo.derecho)
+        # len(pares) >> 1 evita llamar a Posiciones.__len__ en cada inserción
+        nodo.total = (len(nodo.posiciones.pares) >> 1) + self.total(nodo.izquierdo) + self.total(nodo.derecho)
     
     def rotacion_derecha(self, z):
         y = z.izquierdo
@@ -50,20 +76,52 @@ class AVL:
         
         return y
     
+    # Casos de desbalance; cada uno retorna la nueva raíz del subárbol
+    def _balancear_LL(self, nodo):
+        return self.rotacion_derecha(nodo)
+
+    def _balancear_RR(self, nodo):
+        return self.rotacion_izquierda(nodo)
+
+    def _balancear_LR(self, nodo):
+        nodo.izquierdo = self.rotacion_izquierda(nodo.izquierdo)
+        return self.rotacion_derecha(nodo)
+
+    def _balancear_RL(self, nodo):
+        nodo.derecho = self.rotacion_derecha(nodo.derecho)
+        return self.rotacion_izquierda(nodo)
+
     def insertar(self, palabra, linea, columna):
-        self.raiz = self._insertar_recursivo(self.raiz, palabra, linea, columna)
+        nueva_raiz = self._insertar_recursivo(self.raiz, palabra, linea, columna)
+        if nueva_raiz is not None:
+            self.raiz = nueva_raiz
     
     def _insertar_recursivo(self, nodo, palabra, linea, columna):
+        """
+        Retorna la nueva raíz del subárbol, o None si la palabra ya existía:
+        entonces la forma del árbol no cambia y en el camino solo crece total.
+        """
         if not nodo:
             return NodoAVL(palabra, linea, columna)
         
         if palabra < nodo.palabra:
-            nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, palabra, linea, columna)
+            hijo = self._insertar_recursivo(nodo.izquierdo, palabra, linea, columna)
+            if hijo is None:
+                nodo.total += 1
+                return None
+            nodo.izquierdo = hijo
         elif palabra > nodo.palabra:
-            nodo.derecho = self._insertar_recursivo(nodo.derecho, palabra, linea, columna)
+            hijo = self._insertar_recursivo(nodo.derecho, palabra, linea, columna)
+            if hijo is None:
+                nodo.total += 1
+                return None
+            nodo.derecho = hijo
         else:
-            nodo.posiciones.append((linea, columna))
-            return nodo
+            pares = nodo.posiciones.pares
+            pares.append(linea)
+            pares.append(columna)
+            nodo.total += 1
+            return None
         
         self.actualizar_altura(nodo)
         fb = self.factor_balance(nodo)
@@ -71,18 +129,16 @@ class AVL:
         # Casos de rotación
         # LL
         if fb > 1 and palabra < nodo.izquierdo.palabra:
-            return self.rotacion_derecha(nodo)
+            return self._balancear_LL(nodo)
         # RR
         if fb < -1 and palabra > nodo.derecho.palabra:
-            return self.rotacion_izquierda(nodo)
+            return self._balancear_RR(nodo)
         # LR
         if fb > 1 and palabra > nodo.izquierdo.palabra:
-            nodo.izquierdo = self.rotacion_izquierda(nodo.izquierdo)
-            return self.rotacion_derecha(nodo)
+            return self._balancear_LR(nodo)
         # RL
         if fb < -1 and palabra < nodo.derecho.palabra:
-            nodo.derecho = self.rotacion_derecha(nodo.derecho)
-            return self.rotacion_izquierda(nodo)
+            return self._balancear_RL(nodo)
         
         return nodo
 
@@ -99,6 +155,30 @@ class AVL:
         else:
             return self._buscar_recursivo(nodo.derecho, palabra)
 
+    def buscar_muchos(self, palabras):
+        """
+        Busca varias palabras en un solo recorrido del árbol.
+        Las consultas se ordenan y se reparten entre los subárboles, así
+        cada nodo se visita una sola vez aunque esté en el camino de muchas
+        búsquedas. Retorna un dict palabra -> posiciones (o None).
+        """
+        consultas = sorted(set(palabras))
+        resultados = dict.fromkeys(consultas)
+        pila = [(self.raiz, 0, len(consultas))]
+        while pila:
+            nodo, inicio, fin = pila.pop()
+            if nodo is None or inicio >= fin:
+                continue
+            # consultas[inicio:medio] son menores que la palabra del nodo
+            medio = bisect_left(consultas, nodo.palabra, inicio, fin)
+            if medio < fin and consultas[medio] == nodo.palabra:
+                resultados[nodo.palabra] = nodo.posiciones
+                pila.append((nodo.derecho, medio + 1, fin))
+            else:
+                pila.append((nodo.derecho, medio, fin))
+            pila.append((nodo.izquierdo, inicio, medio))
+        return resultados
+
     def eliminar(self, palabra):
         self.raiz = self._eliminar_recursivo(self.raiz, palabra)
 
@@ -132,34 +212,247 @@ class AVL:
         
         # Balanceo tras eliminación
         if fb > 1 and self.factor_balance(nodo.izquierdo) >= 0:
-            return self.rotacion_derecha(nodo)
+            return self._balancear_LL(nodo)
         if fb > 1 and self.factor_balance(nodo.izquierdo) < 0:
-            nodo.izquierdo = self.rotacion_izquierda(nodo.izquierdo)
-            return self.rotacion_derecha(nodo)
+            return self._balancear_LR(nodo)
         if fb < -1 and self.factor_balance(nodo.derecho) <= 0:
-            return self.rotacion_izquierda(nodo)
+            return self._balancear_RR(nodo)
         if fb < -1 and self.factor_balance(nodo.derecho) > 0:
-            nodo.derecho = self.rotacion_derecha(nodo.derecho)
-            return self.rotacion_izquierda(nodo)
+            return self._balancear_RL(nodo)
             
         return nodo
 
+    def eliminar_posiciones(self, palabra, posiciones):
+        """
+        Quita posiciones de una palabra; si no le queda ninguna, la elimina.
+        Retorna cuántas posiciones se quitaron.
+        """
+        camino = []
+        actual = self.raiz
+        while actual and palabra != actual.palabra:
+            camino.append(actual)
+            actual = actual.izquierdo if palabra < actual.palabra else actual.derecho
+        if not actual:
+            return 0
+        quitar = set(posiciones)
+        restantes = [p for p in actual.posiciones if p not in quitar]
+        quitadas = len(actual.posiciones) - len(restantes)
+        if not restantes:
+            self.eliminar(palabra)
+        elif quitadas:
+            actual.posiciones[:] = restantes
+            # Solo cambian los totales de ocurrencias del camino hasta la raíz
+            for nodo in camino:
+                nodo.total -= quitadas
+            actual.total -= quitadas
+        return quitadas
+
     def _encontrar_minimo(self, nodo):
         actual = nodo
         while actual.izquierdo:
             actual = actual.izquierdo
         return actual
 
+    def __len__(self):
+        return self.tamano(self.raiz)
+
+    def rank(self, palabra):
+        """Cantidad de palabras distintas estrictamente menores que palabra."""
+        rango = 0
+        actual = self.raiz
+        while actual:
+            if palabra <= actual.palabra:
+                actual = actual.izquierdo
+            else:
+                rango += 1 + self.tamano(actual.izquierdo)
+                actual = actual.derecho
+        return rango
+
+    def select(self, k):
+        """Retorna la k-ésima palabra en orden (desde 0) y sus posiciones."""
+        if k < 0 or k >= len(self):
+            raise IndexError("select fuera de rango")
+        actual = self.raiz
+        while actual:
+            izquierdo = self.tamano(actual.izquierdo)
+            if k < izquierdo:
+                actual = actual.izquierdo
+            elif k == izquierdo:
+                return (actual.palabra, actual.posiciones)
+            else:
+                k -= izquierdo + 1
+                actual = actual.derecho
+
+    def contar_rango(self, a, b):
+        """Cantidad de palabras distintas p con a <= p <= b."""
+        if a > b:
+            return 0
+        menores_o_iguales_b = self.rank(b) + (1 if self.buscar(b) is not None else 0)
+        return menores_o_iguales_b - self.rank(a)
+
+    def ocurrencias_menores(self, palabra):
+        """Total de ocurrencias de las palabras estrictamente menores que palabra."""
+        acumulado = 0
+        actual = self.raiz
+        while actual:
+            if palabra <= actual.palabra:
+                actual = actual.izquierdo
+            else:
+                acumulado += self.total(actual.izquierdo) + len(actual.posiciones)
+                actual = actual.derecho
+        return acumulado
+
+    def percentil(self, p):
+        """
+        Palabra en el percentil p (0-100) ponderando por ocurrencias:
+        la primera palabra cuya frecuencia acumulada alcanza p% del total.
+        """
+        if not self.raiz:
+            return None
+        objetivo = min(self.raiz.total - 1, int(self.raiz.total * p / 100))
+        actual = self.raiz
+        while actual:
+            izquierdo = self.total(actual.izquierdo)
+            propio = len(actual.posiciones)
+            if objetivo < izquierdo:
+                actual = actual.izquierdo
+            elif objetivo < izquierdo + propio:
+                return (actual.palabra, actual.posiciones)
+            else:
+                objetivo -= izquierdo + propio
+                actual = actual.derecho
+
     def inorden(self):
-        resultado = []
-        self._inorden_recursivo(self.raiz, resultado)
-        return resultado
-    
-    def _inorden_recursivo(self, nodo, resultado):
-        if nodo:
-            self._inorden_recursivo(nodo.izquierdo, resultado)
-            resultado.append((nodo.palabra, nodo.posiciones))
-            self._inorden_recursivo(nodo.derecho, resultado)
+        return list(self)
+
+    @classmethod
+    def desde_ordenado(cls, items):
+        """
+        Construye un AVL balanceado en O(n) a partir de tuplas
+        (palabra, posiciones) ya ordenadas y sin palabras repetidas.
+        """
+        arbol = cls()
+        items = items if isinstance(items, list) else list(items)
+        arbol.raiz = arbol._construir_balanceado(items, 0, len(items))
+        return arbol
+
+    def _construir_balanceado(self, items, inicio, fin):
+        if inicio >= fin:
+            return None
+        medio = (inicio + fin) // 2
+        palabra, posiciones = items[medio]
+        nodo = NodoAVL(palabra, 0, 0)
+        nodo.posiciones = posiciones if isinstance(posiciones, Posiciones) else Posiciones(posiciones)
+        nodo.izquierdo = self._construir_balanceado(items, inicio, medio)
+        nodo.derecho = self._construir_balanceado(items, medio + 1, fin)
+        self.actualizar_altura(nodo)
+        return nodo
+
+    def guardar(self, ruta):
+        """Guarda el índice en formato binario compacto."""
+        largos = array('I')
+        cantidades = array('I')
+        pares = array('I')
+        palabras = []
+        for palabra, posiciones in self:
+            codificada = palabra.encode('utf-8')
+            palabras.append(codificada)
+            largos.append(len(codificada))
+            cantidades.append(len(posiciones.pares) >> 1)
+            pares.extend(posiciones.pares)
+        if sys.byteorder == 'big':
+            for arreglo in (largos, cantidades, pares):
+                arreglo.byteswap()
+        with open(ruta, 'wb') as f:
+            f.write(CABECERA_AVL.pack(MAGIA_AVL, len(largos), len(pares) >> 1))
+            f.write(largos.tobytes())
+            f.write(cantidades.tobytes())
+            f.write(b"".join(palabras))
+            f.write(pares.tobytes())
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Carga un índice guardado con guardar() sin rebalanceos."""
+        with open(ruta, 'rb') as f:
+            datos = f.read()
+        magia, n, total = CABECERA_AVL.unpack_from(datos, 0)
+        if magia != MAGIA_AVL:
+            raise ValueError(f"'{ruta}' no es un índice AVL guardado")
+
+        pos = CABECERA_AVL.size
+        arreglos = []
+        for cantidad in (n, n):
+            arreglo = array('I')
+            fin = pos + cantidad * arreglo.itemsize
+            arreglo.frombytes(datos[pos:fin])
+            arreglos.append(arreglo)
+            pos = fin
+        largos, cantidades = arreglos
+        if sys.byteorder == 'big':
+            largos.byteswap()
+            cantidades.byteswap()
+
+        bloque_palabras = datos[pos:pos + sum(largos)]
+        pos += len(bloque_palabras)
+        pares = array('I')
+        pares.frombytes(datos[pos:pos + 2 * total * pares.itemsize])
+        if sys.byteorder == 'big':
+            pares.byteswap()
+
+        # Cada palabra recibe un corte del array de pares, sin recorrer sus posiciones
+        items = []
+        inicio_palabra = 0
+        inicio_pos = 0
+        for largo, cantidad in zip(largos, cantidades):
+            palabra = bloque_palabras[inicio_palabra:inicio_palabra + largo].decode('utf-8')
+            fin_pos = inicio_pos + 2 * cantidad
+            items.append((palabra, Posiciones.de_pares(pares[inicio_pos:fin_pos])))
+            inicio_palabra += largo
+            inicio_pos = fin_pos
+        return cls.desde_ordenado(items)
+
+    def __iter__(self):
+        """Recorre el índice en orden ascendente sin construir una lista."""
+        pila = []
+        actual = self.raiz
+        while pila or actual:
+            while actual:
+                pila.append(actual)
+                actual = actual.izquierdo
+            actual = pila.pop()
+            yield (actual.palabra, actual.posiciones)
+            actual = actual.derecho
+
+    def iter_desde(self, palabra):
+        """Recorre en orden ascendente a partir de la primera palabra >= palabra."""
+        pila = []
+        actual = self.raiz
+        # Solo se apilan los nodos cuya palabra queda dentro del rango
+        while actual:
+            if palabra <= actual.palabra:
+                pila.append(actual)
+                actual = actual.izquierdo
+            else:
+                actual = actual.derecho
+        while pila:
+            nodo = pila.pop()
+            yield (nodo.palabra, nodo.posiciones)
+            actual = nodo.derecho
+            while actual:
+                pila.append(actual)
+                actual = actual.izquierdo
+
+    def iter_inverso(self):
+        """Recorre el índice en orden descendente."""
+        pila = []
+        actual = self.raiz
+        while pila or actual:
+            while actual:
+                pila.append(actual)
+                actual = actual.derecho
+            actual = pila.pop()
+            yield (actual.palabra, actual.posiciones)
+            actual = actual.izquierdo
 
 if __name__ == "__main__":
     avl = AVL()
@@ -168,4 +461,6 @@ if __name__ == "__main__":
         avl.insertar(p, 1, i+1)
     
     print("Inorden:", avl.inorden())
-    print("Raíz:", avl.raiz.palabra) # Debería estar balanceado
\ No newline at end of file
+    print("Raíz:", avl.raiz.palabra) # Debería estar balanceado
+    print("rank('gato'):", avl.rank("gato"), "| select(0):", avl.select(0)[0])
+    print("Palabras entre 'b' y 'q':", avl.contar_rango("b", "q"))
\ No newline at end of file
@@ -0,0 +1,163 @@
+import threading
+
+class NodoPersistente:
+    """
+    Nodo inmutable: una vez publicado no se modifica nunca. Las posiciones
+    se guardan en una tupla para que tampoco puedan cambiar bajo un lector.
+    """
+    __slots__ = ("palabra", "posiciones", "izquierdo", "derecho", "altura")
+
+    def __init__(self, palabra, posiciones, izquierdo, derecho):
+        self.palabra = palabra
+        self.posiciones = posiciones
+        self.izquierdo = izquierdo
+        self.derecho = derecho
+        self.altura = 1 + max(_altura(izquierdo), _altura(derecho))
+
+def _altura(nodo):
+    return nodo.altura if nodo else 0
+
+def _con_hijos(nodo, izquierdo, derecho):
+    """Copia de nodo con otros hijos."""
+    return NodoPersistente(nodo.palabra, nodo.posiciones, izquierdo, derecho)
+
+def _balancear(palabra, posiciones, izquierdo, derecho):
+    """
+    Crea el nodo (palabra, izquierdo, derecho) ya balanceado. Las rotaciones
+    construyen nodos nuevos en lugar de reenlazar los existentes.
+    """
+    fb = _altura(izquierdo) - _altura(derecho)
+    if fb > 1:
+        if _altura(izquierdo.izquierdo) < _altura(izquierdo.derecho):
+            # LR: primero rotación izquierda del hijo
+            medio = izquierdo.derecho
+            izquierdo = _con_hijos(medio, _con_hijos(izquierdo, izquierdo.izquierdo, medio.izquierdo), medio.derecho)
+        # LL
+        return _con_hijos(izquierdo, izquierdo.izquierdo,
+                          NodoPersistente(palabra, posiciones, izquierdo.derecho, derecho))
+    if fb < -1:
+        if _altura(derecho.derecho) < _altura(derecho.izquierdo):
+            # RL: primero rotación derecha del hijo
+            medio = derecho.izquierdo
+            derecho = _con_hijos(medio, medio.izquierdo, _con_hijos(derecho, medio.derecho, derecho.derecho))
+        # RR
+        return _con_hijos(derecho, NodoPersistente(palabra, posiciones, izquierdo, derecho.izquierdo),
+                          derecho.derecho)
+    return NodoPersistente(palabra, posiciones, izquierdo, derecho)
+
+def _insertar(nodo, palabra, posicion):
+    if nodo is None:
+        return NodoPersistente(palabra, (posicion,), None, None)
+    if palabra < nodo.palabra:
+        return _balancear(nodo.palabra, nodo.posiciones, _insertar(nodo.izquierdo, palabra, posicion), nodo.derecho)
+    if palabra > nodo.palabra:
+        return _balancear(nodo.palabra, nodo.posiciones, nodo.izquierdo, _insertar(nodo.derecho, palabra, posicion))
+    return NodoPersistente(nodo.palabra, nodo.posiciones + (posicion,), nodo.izquierdo, nodo.derecho)
+
+def _quitar_minimo(nodo):
+    """Retorna (subárbol sin su mínimo, nodo mínimo)."""
+    if nodo.izquierdo is None:
+        return nodo.derecho, nodo
+    izquierdo, minimo = _quitar_minimo(nodo.izquierdo)
+    return _balancear(nodo.palabra, nodo.posiciones, izquierdo, nodo.derecho), minimo
+
+def _eliminar(nodo, palabra):
+    if nodo is None:
+        return None
+    if palabra < nodo.palabra:
+        izquierdo = _eliminar(nodo.izquierdo, palabra)
+        if izquierdo is nodo.izquierdo:
+            return nodo  # No estaba: se comparte el subárbol completo
+        return _balancear(nodo.palabra, nodo.posiciones, izquierdo, nodo.derecho)
+    if palabra > nodo.palabra:
+        derecho = _eliminar(nodo.derecho, palabra)
+        if derecho is nodo.derecho:
+            return nodo
+        return _balancear(nodo.palabra, nodo.posiciones, nodo.izquierdo, derecho)
+    if nodo.izquierdo is None:
+        return nodo.derecho
+    if nodo.derecho is None:
+        return nodo.izquierdo
+    derecho, sucesor = _quitar_minimo(nodo.derecho)
+    return _balancear(sucesor.palabra, sucesor.posiciones, nodo.izquierdo, derecho)
+
+def _buscar(nodo, palabra):
+    while nodo is not None:
+        if palabra == nodo.palabra:
+            return nodo.posiciones
+        nodo = nodo.izquierdo if palabra < nodo.palabra else nodo.derecho
+    return None
+
+def _recorrer(nodo):
+    pila = []
+    while pila or nodo:
+        while nodo:
+            pila.append(nodo)
+            nodo = nodo.izquierdo
+        nodo = pila.pop()
+        yield (nodo.palabra, nodo.posiciones)
+        nodo = nodo.derecho
+
+class Instantanea:
+    """Vista de solo lectura del índice en un momento dado. Crearla es O(1)."""
+    __slots__ = ("raiz",)
+
+    def __init__(self, raiz):
+        self.raiz = raiz
+
+    def buscar(self, palabra):
+        return _buscar(self.raiz, palabra)
+
+    def inorden(self):
+        return list(self)
+
+    def __iter__(self):
+        return _recorrer(self.raiz)
+
+class AVLPersistente:
+    """
+    AVL persistente (copia de camino) para lectura concurrente.
+    Cada escritura copia solo los O(log n) nodos del camino modificado y
+    publica la nueva raíz con una única asignación, que es atómica. Los
+    lectores toman la raíz vigente y trabajan sobre nodos que nunca cambian,
+    sin usar locks; los escritores se serializan entre sí con un lock.
+    Misma interfaz que AVL, pero buscar() retorna una tupla de posiciones.
+    """
+
+    def __init__(self):
+        self.raiz = None
+        self._escritura = threading.Lock()
+
+    def insertar(self, palabra, linea, columna):
+        with self._escritura:
+            self.raiz = _insertar(self.raiz, palabra, (linea, columna))
+
+    def eliminar(self, palabra):
+        with self._escritura:
+            self.raiz = _eliminar(self.raiz, palabra)
+
+    def buscar(self, palabra):
+        return _buscar(self.raiz, palabra)
+
+    def instantanea(self):
+        """Versión actual del índice; no cambia aunque sigan llegando escrituras."""
+        return Instantanea(self.raiz)
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+    def __iter__(self):
+        # El recorrido usa la raíz vigente al empezar: es consistente aunque haya escrituras
+        return _recorrer(self.raiz)
+
+if __name__ == "__main__":
+    indice = AVLPersistente()
+    palabras = ["perro", "gato", "casa", "arbol", "zorro", "perro"]
+    for i, p in enumerate(palabras):
+        indice.insertar(p, 1, i + 1)
+
+    antes = indice.instantanea()
+    indice.eliminar("gato")
+    print("Instantánea previa:", antes.inorden())
+    print("Índice actual:", indice.inorden())
@@ -0,0 +1,210 @@
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from main import MOTORES
+from tokenizador import tokens_de_archivo
+
+TAMANOS = [1000, 5000, 20000]
+DISTRIBUCIONES = ["ordenada", "aleatoria", "zipf"]
+
+def medir(funcion, repeticiones=20, calentamiento=3, lote=1):
+    """
+    Ejecuta `funcion` varias veces y retorna los tiempos en ns por llamada.
+    Las primeras `calentamiento` ejecuciones se descartan. Con `lote` > 1 se
+    cronometran varias llamadas juntas y se divide, para que operaciones de
+    menos de un microsegundo no queden por debajo de la resolución del reloj.
+    """
+    for _ in range(calentamiento):
+        for _ in range(lote):
+            funcion()
+    muestras = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter_ns()
+        for _ in range(lote):
+            funcion()
+        muestras.append((time.perf_counter_ns() - inicio) / lote)
+    return muestras
+
+def percentil(ordenadas, p):
+    """Percentil p (0-100) de una lista ya ordenada, con interpolación lineal."""
+    if len(ordenadas) == 1:
+        return ordenadas[0]
+    posicion = (len(ordenadas) - 1) * p / 100
+    abajo = int(posicion)
+    arriba = min(abajo + 1, len(ordenadas) - 1)
+    return ordenadas[abajo] + (ordenadas[arriba] - ordenadas[abajo]) * (posicion - abajo)
+
+def resumen(muestras):
+    ordenadas = sorted(muestras)
+    return {
+        "min": ordenadas[0],
+        "p50": percentil(ordenadas, 50),
+        "p90": percentil(ordenadas, 90),
+        "p99": percentil(ordenadas, 99),
+        "media": statistics.fmean(ordenadas),
+        "desv": statistics.pstdev(ordenadas),
+    }
+
+def generar_claves(distribucion, n, semilla=0):
+    """
+    Secuencia de n palabras a insertar:
+    - ordenada: n palabras distintas en orden creciente (peor caso del BST),
+    - aleatoria: las mismas palabras en orden aleatorio,
+    - zipf: n apariciones sobre un vocabulario de n // 10 palabras, con
+      frecuencia proporcional a 1/rango como en un texto real.
+    """
+    azar = random.Random(semilla)
+    if distribucion == "zipf":
+        vocabulario = [f"palabra{i:07d}" for i in range(max(1, n // 10))]
+        azar.shuffle(vocabulario)
+        pesos = [1 / (i + 1) for i in range(len(vocabulario))]
+        return azar.choices(vocabulario, weights=pesos, k=n)
+    claves = [f"palabra{i:07d}" for i in range(n)]
+    if distribucion == "aleatoria":
+        azar.shuffle(claves)
+    return claves
+
+def altura_de(indice):
+    """
+    Altura del árbol (nodos en el camino más largo), o None si no es un árbol.
+    Para árboles de varios hijos (radix) es la profundidad del trie.
+    """
+    raiz = getattr(indice, "raiz", None)
+    if raiz is None:
+        return None
+    nulo = getattr(indice, "nulo", None)
+    altura = 0
+    pila = [(raiz, 1)]
+    while pila:
+        nodo, nivel = pila.pop()
+        if nodo is None or nodo is nulo:
+            continue
+        altura = max(altura, nivel)
+        hijos = nodo.hijos.values() if hasattr(nodo, "hijos") else (nodo.izquierdo, nodo.derecho)
+        for hijo in hijos:
+            pila.append((hijo, nivel + 1))
+    return altura
+
+def contar_rotaciones(indice):
+    """
+    Envuelve los métodos de rotación de esta instancia para contarlos.
+    Retorna un dict cuyo valor 'rotaciones' se actualiza en cada llamada.
+    """
+    contador = {"rotaciones": 0}
+    for nombre in ("rotacion_derecha", "rotacion_izquierda"):
+        original = getattr(indice, nombre, None)
+        if original is None:
+            continue
+
+        def envoltura(*args, _original=original):
+            contador["rotaciones"] += 1
+            return _original(*args)
+
+        setattr(indice, nombre, envoltura)
+    return contador
+
+def construir(clase, claves):
+    indice = clase()
+    for i, palabra in enumerate(claves):
+        indice.insertar(palabra, i, 1)
+    return indice
+
+def medir_estructura(clase, claves, consultas, repeticiones=5):
+    """Tiempos de construcción y búsqueda, altura, rotaciones y memoria de una estructura."""
+    construcciones = medir(lambda: construir(clase, claves), repeticiones=repeticiones, calentamiento=1)
+
+    # Construcción aparte para contar rotaciones sin afectar los tiempos
+    indice = clase()
+    contador = contar_rotaciones(indice)
+    for i, palabra in enumerate(claves):
+        indice.insertar(palabra, i, 1)
+
+    posicion = [0]
+    def una_busqueda():
+        indice.buscar(consultas[posicion[0] % len(consultas)])
+        posicion[0] += 1
+    busquedas = medir(una_busqueda, repeticiones=200, calentamiento=5, lote=50)
+
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    medido = construir(clase, claves)
+    memoria = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    del medido
+
+    return {
+        "construccion": resumen(construcciones),
+        "busqueda": resumen(busquedas),
+        "altura": altura_de(indice),
+        "rotaciones": contador["rotaciones"],
+        "memoria_por_palabra": memoria / max(1, len(set(claves))),
+    }
+
+def ejecutar(tamanos=TAMANOS, distribuciones=DISTRIBUCIONES, motores=MOTORES):
+    print(f"{'Estructura':<18} | {'Dist.':<9} | {'n':>6} | {'constr. p50 (ms)':>16} | "
+          f"{'búsq. p50 (ns)':>14} | {'búsq. p99 (ns)':>14} | {'altura':>6} | {'rot.':>6} | {'B/palabra':>9}")
+    print("-" * 124)
+    for distribucion in distribuciones:
+        for n in tamanos:
+            claves = generar_claves(distribucion, n)
+            consultas = random.Random(1).sample(claves, min(len(claves), 1000))
+            for nombre, clase in motores.items():
+                try:
+                    r = medir_estructura(clase, claves, consultas)
+                except RecursionError:
+                    # El BST degenera en lista con entrada ordenada y su inserción es recursiva
+                    print(f"{nombre:<18} | {distribucion:<9} | {n:>6} | {'RecursionError':>16} |")
+                    continue
+                altura = "-" if r["altura"] is None else r["altura"]
+                print(f"{nombre:<18} | {distribucion:<9} | {n:>6} | "
+                      f"{r['construccion']['p50'] / 1e6:>16.3f} | {r['busqueda']['p50']:>14.0f} | "
+                      f"{r['busqueda']['p99']:>14.0f} | {altura:>6} | {r['rotaciones']:>6} | "
+                      f"{r['memoria_por_palabra']:>9.0f}")
+
+def traza_zipf(indice, n, semilla=0):
+    """
+    Traza sintética de n consultas sobre las palabras del índice: la palabra
+    con rango de frecuencia r se consulta con probabilidad proporcional a 1/r.
+    """
+    vocabulario = [p for p, _ in sorted(indice, key=lambda item: -len(item[1]))]
+    pesos = [1 / (i + 1) for i in range(len(vocabulario))]
+    return random.Random(semilla).choices(vocabulario, weights=pesos, k=n)
+
+def cargar_traza(ruta):
+    """Traza grabada: una consulta por línea."""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        return [linea.strip().lower() for linea in f if linea.strip()]
+
+def comparar_traza(consultas, ruta_corpus="test_data.txt", motores=("AVL", "Splay"), repeticiones=10):
+    """Reproduce la traza de consultas sobre cada estructura; retorna ns por consulta (p50)."""
+    resultados = {}
+    for nombre in motores:
+        indice = MOTORES[nombre]()
+        for palabra, linea, columna in tokens_de_archivo(ruta_corpus):
+            indice.insertar(palabra, linea, columna)
+
+        def reproducir():
+            for palabra in consultas:
+                indice.buscar(palabra)
+
+        muestras = medir(reproducir, repeticiones=repeticiones, calentamiento=1)
+        resultados[nombre] = resumen(muestras)["p50"] / len(consultas)
+        print(f"{nombre:<10} | {resultados[nombre]:>10.0f} ns por consulta")
+    return resultados
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["traza"]:
+        # python benchmark.py traza [archivo_traza]
+        if len(sys.argv) > 2:
+            consultas = cargar_traza(sys.argv[2])
+        else:
+            referencia = MOTORES["Dict + orden"]()
+            for palabra, linea, columna in tokens_de_archivo("test_data.txt"):
+                referencia.insertar(palabra, linea, columna)
+            consultas = traza_zipf(referencia, 20000)
+        comparar_traza(consultas)
+    else:
+        tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS
+        ejecutar(tamanos)
@@ -1,7 +1,13 @@
+from bisect import bisect_left
+from posiciones import Posiciones
+
 class NodoBST:
+    # Sin __dict__ por nodo: menos memoria y atributos en posiciones fijas
+    __slots__ = ("palabra", "posiciones", "izquierdo", "derecho")
+
     def __init__(self, palabra, linea, columna):
         self.palabra = palabra
-        self.posiciones = [(linea, columna)]  # Lista de tuplas (linea, columna)
+        self.posiciones = Posiciones.de_par(linea, columna)  # Pares (linea, columna) en un array
         self.izquierdo = None
         self.derecho = None
 
@@ -34,7 +40,9 @@ class BST:
                 self._insertar_recursivo(nodo.derecho, palabra, linea, columna)
         else:
             # La palabra ya existe, agregamos la nueva posición
-            nodo.posiciones.append((linea, columna))
+            pares = nodo.posiciones.pares
+            pares.append(linea)
+            pares.append(columna)
     
     def buscar(self, palabra):
         """Busca una palabra y retorna sus posiciones o None."""
@@ -50,6 +58,30 @@ class BST:
         else:
             return self._buscar_recursivo(nodo.derecho, palabra)
     
+    def buscar_muchos(self, palabras):
+        """
+        Busca varias palabras en un solo recorrido del árbol.
+        Las consultas se ordenan y se reparten entre los subárboles, así
+        cada nodo se visita una sola vez aunque esté en el camino de muchas
+        búsquedas. Retorna un dict palabra -> posiciones (o None).
+        """
+        consultas = sorted(set(palabras))
+        resultados = dict.fromkeys(consultas)
+        pila = [(self.raiz, 0, len(consultas))]
+        while pila:
+            nodo, inicio, fin = pila.pop()
+            if nodo is None or inicio >= fin:
+                continue
+            # consultas[inicio:medio] son menores que la palabra del nodo
+            medio = bisect_left(consultas, nodo.palabra, inicio, fin)
+            if medio < fin and consultas[medio] == nodo.palabra:
+                resultados[nodo.palabra] = nodo.posiciones
+                pila.append((nodo.derecho, medio + 1, fin))
+            else:
+                pila.append((nodo.derecho, medio, fin))
+            pila.append((nodo.izquierdo, inicio, medio))
+        return resultados
+    
     def eliminar(self, palabra):
         """Elimina una palabra del índice."""
         self.raiz = self._eliminar_recursivo(self.raiz, palabra)
@@ -81,6 +113,25 @@ class BST:
         
         return nodo
     
+    def eliminar_posiciones(self, palabra, posiciones):
+        """
+        Quita posiciones de una palabra; si no le queda ninguna, la elimina.
+        Retorna cuántas posiciones se quitaron.
+        """
+        actual = self.raiz
+        while actual is not None and palabra != actual.palabra:
+            actual = actual.izquierdo if palabra < actual.palabra else actual.derecho
+        if actual is None:
+            return 0
+        quitar = set(posiciones)
+        restantes = [p for p in actual.posiciones if p not in quitar]
+        quitadas = len(actual.posiciones) - len(restantes)
+        if not restantes:
+            self.eliminar(palabra)
+        else:
+            actual.posiciones[:] = restantes
+        return quitadas
+    
     def _encontrar_minimo(self, nodo):
         actual = nodo
         while actual.izquierdo is not None:
@@ -89,15 +140,50 @@ class BST:
     
     def inorden(self):
         """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
-        resultado = []
-        self._inorden_recursivo(self.raiz, resultado)
-        return resultado
-    
-    def _inorden_recursivo(self, nodo, resultado):
-        if nodo:
-            self._inorden_recursivo(nodo.izquierdo, resultado)
-            resultado.append((nodo.palabra, nodo.posiciones))
-            self._inorden_recursivo(nodo.derecho, resultado)
+        return list(self)
+
+    def __iter__(self):
+        """Recorre el índice en orden ascendente sin construir una lista."""
+        pila = []
+        actual = self.raiz
+        while pila or actual:
+            while actual:
+                pila.append(actual)
+                actual = actual.izquierdo
+            actual = pila.pop()
+            yield (actual.palabra, actual.posiciones)
+            actual = actual.derecho
+
+    def iter_desde(self, palabra):
+        """Recorre en orden ascendente a partir de la primera palabra >= palabra."""
+        pila = []
+        actual = self.raiz
+        # Solo se apilan los nodos cuya palabra queda dentro del rango
+        while actual:
+            if palabra <= actual.palabra:
+                pila.append(actual)
+                actual = actual.izquierdo
+            else:
+                actual = actual.derecho
+        while pila:
+            nodo = pila.pop()
+            yield (nodo.palabra, nodo.posiciones)
+            actual = nodo.derecho
+            while actual:
+                pila.append(actual)
+                actual = actual.izquierdo
+
+    def iter_inverso(self):
+        """Recorre el índice en orden descendente."""
+        pila = []
+        actual = self.raiz
+        while pila or actual:
+            while actual:
+                pila.append(actual)
+                actual = actual.derecho
+            actual = pila.pop()
+            yield (actual.palabra, actual.posiciones)
+            actual = actual.izquierdo
 
 if __name__ == "__main__":
     # Pruebas básicas
@@ -108,6 +194,7 @@ if __name__ == "__main__":
     
     print("Búsqueda 'hola':", bst.buscar("hola"))
     print("Inorden:", bst.inorden())
+    print("Desde 'i':", list(bst.iter_desde("i")))
     
     bst.eliminar("hola")
     print("Después de eliminar 'hola':", bst.inorden())
\ No newline at end of file
@@ -0,0 +1,458 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
+# Formato del archivo: páginas de tamaño fijo. La página 0 es la cabecera.
+TAM_PAGINA = 4096
+MAGIA = b"BTX1"
+CABECERA = struct.Struct("<4sIIIII")  # magia, tam_pagina, raiz, num_paginas, libre, num_palabras
+
+HOJA = 1
+INTERNA = 2
+POSTINGS = 3
+LIBRE = 4
+
+ENC_HOJA = struct.Struct("<BHI")      # tipo, n, siguiente hoja
+ENC_INTERNA = struct.Struct("<BH")    # tipo, n claves
+ENC_POSTINGS = struct.Struct("<BHI")  # tipo, n pares, siguiente página de postings
+ENC_LIBRE = struct.Struct("<BI")      # tipo, siguiente página libre
+VALOR_HOJA = struct.Struct("<III")    # primera página de postings, última, cantidad
+PAR = struct.Struct("<II")            # (linea, columna)
+HIJO = struct.Struct("<I")
+
+MAX_CLAVE = 255
+# Las palabras guardan sus posiciones dentro de la hoja mientras la entrada
+# completa (clave, valor y pares) ocupe a lo sumo media página; recién
+# después pasan a una cadena de páginas de postings, que así empieza al
+# menos a la mitad de su capacidad. Con entradas de hasta media página una
+# hoja desbordada siempre se puede partir en dos hojas que caben.
+MAX_ENTRADA_EN_HOJA = (TAM_PAGINA - ENC_HOJA.size) // 2
+PARES_POR_PAGINA = (TAM_PAGINA - ENC_POSTINGS.size) // PAR.size
+
+
+def _tam_entrada(clave, valor):
+    return 1 + len(clave) + VALOR_HOJA.size + PAR.size * len(valor[3])
+
+
+class _Hoja:
+    __slots__ = ("claves", "valores", "siguiente", "tam")
+
+    def __init__(self, claves=None, valores=None, siguiente=0):
+        self.claves = claves if claves is not None else []
+        # [primera, ultima, cantidad, pares en la hoja]; primera == 0 si no hay páginas
+        self.valores = valores if valores is not None else []
+        self.siguiente = siguiente
+        self.recalcular()
+
+    def recalcular(self):
+        # Bytes que ocupa la hoja serializada; se actualiza de forma incremental
+        self.tam = ENC_HOJA.size + sum(_tam_entrada(c, v) for c, v in zip(self.claves, self.valores))
+
+
+class _Interna:
+    __slots__ = ("claves", "hijos", "tam")
+
+    def __init__(self, claves=None, hijos=None):
+        self.claves = claves if claves is not None else []
+        self.hijos = hijos if hijos is not None else []
+        self.recalcular()
+
+    def recalcular(self):
+        self.tam = (ENC_INTERNA.size + HIJO.size * len(self.hijos)
+                    + sum(1 + len(c) for c in self.claves))
+
+
+class _Postings:
+    __slots__ = ("pares", "siguiente")
+
+    def __init__(self, pares=None, siguiente=0):
+        self.pares = pares if pares is not None else []
+        self.siguiente = siguiente
+
+
+class _Libre:
+    __slots__ = ("siguiente",)
+
+    def __init__(self, siguiente=0):
+        self.siguiente = siguiente
+
+
+def _decodificar(buf, inicio):
+    tipo = buf[inicio]
+    if tipo == HOJA:
+        _, n, siguiente = ENC_HOJA.unpack_from(buf, inicio)
+        pos = inicio + ENC_HOJA.size
+        claves, valores = [], []
+        for _ in range(n):
+            largo = buf[pos]
+            claves.append(bytes(buf[pos + 1:pos + 1 + largo]))
+            pos += 1 + largo
+            primera, ultima, cantidad = VALOR_HOJA.unpack_from(buf, pos)
+            pos += VALOR_HOJA.size
+            en_hoja = []
+            if not primera:
+                en_hoja = [PAR.unpack_from(buf, pos + i * PAR.size) for i in range(cantidad)]
+                pos += cantidad * PAR.size
+            valores.append([primera, ultima, cantidad, en_hoja])
+        return _Hoja(claves, valores, siguiente)
+    if tipo == INTERNA:
+        _, n = ENC_INTERNA.unpack_from(buf, inicio)
+        pos = inicio + ENC_INTERNA.size
+        hijos = [HIJO.unpack_from(buf, pos + i * HIJO.size)[0] for i in range(n + 1)]
+        pos += (n + 1) * HIJO.size
+        claves = []
+        for _ in range(n):
+            largo = buf[pos]
+            claves.append(bytes(buf[pos + 1:pos + 1 + largo]))
+            pos += 1 + largo
+        return _Interna(claves, hijos)
+    if tipo == POSTINGS:
+        _, n, siguiente = ENC_POSTINGS.unpack_from(buf, inicio)
+        pos = inicio + ENC_POSTINGS.size
+        pares = [PAR.unpack_from(buf, pos + i * PAR.size) for i in range(n)]
+        return _Postings(pares, siguiente)
+    if tipo == LIBRE:
+        return _Libre(ENC_LIBRE.unpack_from(buf, inicio)[1])
+    raise ValueError(f"Tipo de página desconocido: {tipo}")
+
+
+def _codificar(pagina):
+    partes = []
+    if isinstance(pagina, _Hoja):
+        partes.append(ENC_HOJA.pack(HOJA, len(pagina.claves), pagina.siguiente))
+        for clave, valor in zip(pagina.claves, pagina.valores):
+            partes.append(bytes((len(clave),)))
+            partes.append(clave)
+            partes.append(VALOR_HOJA.pack(valor[0], valor[1], valor[2]))
+            partes.extend(PAR.pack(*par) for par in valor[3])
+    elif isinstance(pagina, _Interna):
+        partes.append(ENC_INTERNA.pack(INTERNA, len(pagina.claves)))
+        partes.extend(HIJO.pack(h) for h in pagina.hijos)
+        for clave in pagina.claves:
+            partes.append(bytes((len(clave),)))
+            partes.append(clave)
+    elif isinstance(pagina, _Postings):
+        partes.append(ENC_POSTINGS.pack(POSTINGS, len(pagina.pares), pagina.siguiente))
+        partes.extend(PAR.pack(*par) for par in pagina.pares)
+    else:
+        partes.append(ENC_LIBRE.pack(LIBRE, pagina.siguiente))
+    datos = b"".join(partes)
+    if len(datos) > TAM_PAGINA:
+        raise ValueError("La página excede el tamaño máximo")
+    return datos
+
+
+class BTreeDisco:
+    """
+    Árbol B+ persistente en disco para indexación de texto.
+    Misma interfaz que BST/AVL (insertar, buscar, eliminar, inorden).
+    Las páginas se leen a través de mmap y las más usadas se mantienen
+    decodificadas en una caché LRU; las modificadas se escriben al
+    desalojarse o al llamar a guardar()/cerrar().
+
+    Las claves son la palabra en UTF-8 (el orden de bytes coincide con el
+    orden de str). Cada hoja guarda, por palabra, sus primeras posiciones
+    (linea, columna); las palabras frecuentes pasan a una cadena de páginas
+    de postings a la que se agregan posiciones nuevas.
+    La eliminación es perezosa: las hojas pueden quedar con pocas claves,
+    pero las búsquedas siguen siendo correctas.
+    """
+
+    def __init__(self, ruta, capacidad_cache=256):
+        self.ruta = ruta
+        # Una inserción toca a lo sumo unas pocas páginas a la vez
+        self.capacidad_cache = max(capacidad_cache, 16)
+        self._cache = OrderedDict()  # numero de página -> página decodificada
+        self._sucias = set()
+
+        nuevo = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+        self._archivo = open(ruta, "w+b" if nuevo else "r+b")
+        if nuevo:
+            self._archivo.truncate(TAM_PAGINA * 16)
+            self._mm = mmap.mmap(self._archivo.fileno(), 0)
+            self.raiz = 1
+            self.num_paginas = 2
+            self.libre = 0
+            self.num_palabras = 0
+            self._cache[1] = _Hoja()
+            self._sucias.add(1)
+            self._escribir_cabecera()
+        else:
+            self._mm = mmap.mmap(self._archivo.fileno(), 0)
+            magia, tam, raiz, num_paginas, libre, num_palabras = CABECERA.unpack_from(self._mm, 0)
+            if magia != MAGIA or tam != TAM_PAGINA:
+                self.cerrar()
+                raise ValueError(f"'{ruta}' no es un índice B+ válido")
+            self.raiz = raiz
+            self.num_paginas = num_paginas
+            self.libre = libre
+            self.num_palabras = num_palabras
+
+    # --- Gestión de páginas ---
+
+    def _escribir_cabecera(self):
+        CABECERA.pack_into(self._mm, 0, MAGIA, TAM_PAGINA, self.raiz,
+                           self.num_paginas, self.libre, self.num_palabras)
+
+    def _leer(self, num):
+        pagina = self._cache.get(num)
+        if pagina is not None:
+            self._cache.move_to_end(num)
+            return pagina
+        pagina = _decodificar(self._mm, num * TAM_PAGINA)
+        self._cache[num] = pagina
+        self._desalojar()
+        return pagina
+
+    def _marcar(self, num, pagina):
+        # Se reinserta la página por si fue desalojada mientras se modificaba
+        self._cache[num] = pagina
+        self._cache.move_to_end(num)
+        self._sucias.add(num)
+
+    def _escribir_pagina(self, num, pagina):
+        datos = _codificar(pagina)
+        inicio = num * TAM_PAGINA
+        self._mm[inicio:inicio + len(datos)] = datos
+
+    def _desalojar(self):
+        while len(self._cache) > self.capacidad_cache:
+            num, pagina = self._cache.popitem(last=False)
+            if num in self._sucias:
+                self._escribir_pagina(num, pagina)
+                self._sucias.discard(num)
+
+    def _crecer(self, paginas):
+        tam = len(self._mm)
+        if paginas * TAM_PAGINA <= tam:
+            return
+        nuevo_tam = max(tam * 2, paginas * TAM_PAGINA)
+        self._mm.close()
+        self._archivo.truncate(nuevo_tam)
+        self._mm = mmap.mmap(self._archivo.fileno(), 0)
+
+    def _nueva_pagina(self, pagina):
+        if self.libre:
+            num = self.libre
+            self.libre = self._leer(num).siguiente
+        else:
+            num = self.num_paginas
+            self.num_paginas += 1
+            self._crecer(self.num_paginas)
+        self._marcar(num, pagina)
+        self._desalojar()
+        return num
+
+    def _liberar_pagina(self, num):
+        self._marcar(num, _Libre(self.libre))
+        self.libre = num
+        self._desalojar()
+
+    def guardar(self):
+        """Escribe en el archivo todas las páginas modificadas y la cabecera."""
+        for num in list(self._sucias):
+            self._escribir_pagina(num, self._cache[num])
+        self._sucias.clear()
+        self._escribir_cabecera()
+        self._mm.flush()
+
+    def cerrar(self):
+        if self._mm.closed:
+            return
+        self.guardar()
+        self._mm.close()
+        # Se descarta el espacio reservado de más al crecer
+        self._archivo.truncate(self.num_paginas * TAM_PAGINA)
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    # --- Operaciones del índice ---
+
+    def _clave(self, palabra):
+        clave = palabra.encode("utf-8")
+        if len(clave) > MAX_CLAVE:
+            raise ValueError(f"Palabra demasiado larga para el índice ({len(clave)} bytes)")
+        return clave
+
+    def _buscar_hoja(self, clave):
+        num = self.raiz
+        pagina = self._leer(num)
+        while isinstance(pagina, _Interna):
+            num = pagina.hijos[bisect_right(pagina.claves, clave)]
+            pagina = self._leer(num)
+        return num, pagina
+
+    def insertar(self, palabra, linea, columna):
+        """Inserta una palabra o agrega una nueva posición si ya existe."""
+        clave = self._clave(palabra)
+        division = self._insertar_recursivo(self.raiz, clave, (linea, columna))
+        if division:
+            separador, derecha = division
+            self.raiz = self._nueva_pagina(_Interna([separador], [self.raiz, derecha]))
+
+    def _insertar_recursivo(self, num, clave, par):
+        pagina = self._leer(num)
+        if isinstance(pagina, _Hoja):
+            i = bisect_left(pagina.claves, clave)
+            if i < len(pagina.claves) and pagina.claves[i] == clave:
+                valor = pagina.valores[i]
+                antes = len(valor[3])
+                self._agregar_posting(clave, valor, par)
+                pagina.tam += PAR.size * (len(valor[3]) - antes)
+            else:
+                valor = [0, 0, 1, [par]]
+                pagina.claves.insert(i, clave)
+                pagina.valores.insert(i, valor)
+                pagina.tam += _tam_entrada(clave, valor)
+                self.num_palabras += 1
+            self._marcar(num, pagina)
+            if pagina.tam <= TAM_PAGINA:
+                return None
+            # Se parte por bytes y no por cantidad de claves, porque las entradas
+            # miden distinto: el corte más parejo entre los que dejan ambas
+            # mitades dentro de una página
+            prefijo = [0, *accumulate(_tam_entrada(c, v) for c, v in zip(pagina.claves, pagina.valores))]
+            total = prefijo[-1]
+            limite = TAM_PAGINA - ENC_HOJA.size
+            mitad = min((i for i in range(1, len(prefijo) - 1)
+                         if prefijo[i] <= limite and total - prefijo[i] <= limite),
+                        key=lambda i: abs(2 * prefijo[i] - total))
+            derecha = _Hoja(pagina.claves[mitad:], pagina.valores[mitad:], pagina.siguiente)
+            del pagina.claves[mitad:]
+            del pagina.valores[mitad:]
+            pagina.recalcular()
+            num_derecha = self._nueva_pagina(derecha)
+            pagina.siguiente = num_derecha
+            self._marcar(num, pagina)
+            return derecha.claves[0], num_derecha
+
+        i = bisect_right(pagina.claves, clave)
+        division = self._insertar_recursivo(pagina.hijos[i], clave, par)
+        if not division:
+            return None
+        # La página pudo desalojarse durante la recursión: se vuelve a leer
+        pagina = self._leer(num)
+        separador, num_hijo = division
+        pagina.claves.insert(i, separador)
+        pagina.hijos.insert(i + 1, num_hijo)
+        pagina.tam += 1 + len(separador) + HIJO.size
+        self._marcar(num, pagina)
+        if pagina.tam <= TAM_PAGINA:
+            return None
+        mitad = len(pagina.claves) // 2
+        separador = pagina.claves[mitad]
+        derecha = _Interna(pagina.claves[mitad + 1:], pagina.hijos[mitad + 1:])
+        del pagina.claves[mitad:]
+        del pagina.hijos[mitad + 1:]
+        pagina.recalcular()
+        num_derecha = self._nueva_pagina(derecha)
+        self._marcar(num, pagina)
+        return separador, num_derecha
+
+    def _agregar_posting(self, clave, valor, par):
+        if not valor[0]:
+            if _tam_entrada(clave, valor) + PAR.size <= MAX_ENTRADA_EN_HOJA:
+                valor[3].append(par)
+                valor[2] += 1
+                return
+            # Se desborda: las posiciones pasan a una página propia
+            primera = self._nueva_pagina(_Postings(valor[3] + [par]))
+            valor[0] = valor[1] = primera
+            valor[3] = []
+            valor[2] += 1
+            return
+        ultima = self._leer(valor[1])
+        if len(ultima.pares) < PARES_POR_PAGINA:
+            ultima.pares.append(par)
+            self._marcar(valor[1], ultima)
+        else:
+            nueva = self._nueva_pagina(_Postings([par]))
+            ultima.siguiente = nueva
+            self._marcar(valor[1], ultima)
+            valor[1] = nueva
+        valor[2] += 1
+
+    def _leer_postings(self, valor):
+        if not valor[0]:
+            return list(valor[3])
+        num = valor[0]
+        posiciones = []
+        while num:
+            pagina = self._leer(num)
+            posiciones.extend(pagina.pares)
+            num = pagina.siguiente
+        return posiciones
+
+    def buscar(self, palabra):
+        """Busca una palabra y retorna sus posiciones o None."""
+        clave = palabra.encode("utf-8")
+        _, hoja = self._buscar_hoja(clave)
+        i = bisect_left(hoja.claves, clave)
+        if i < len(hoja.claves) and hoja.claves[i] == clave:
+            return self._leer_postings(hoja.valores[i])
+        return None
+
+    def eliminar(self, palabra):
+        """Elimina una palabra del índice y libera sus páginas de postings."""
+        clave = palabra.encode("utf-8")
+        num, hoja = self._buscar_hoja(clave)
+        i = bisect_left(hoja.claves, clave)
+        if i == len(hoja.claves) or hoja.claves[i] != clave:
+            return
+        actual = hoja.valores[i][0]
+        hoja.tam -= _tam_entrada(clave, hoja.valores[i])
+        del hoja.claves[i]
+        del hoja.valores[i]
+        self._marcar(num, hoja)
+        self.num_palabras -= 1
+        while actual:
+            siguiente = self._leer(actual).siguiente
+            self._liberar_pagina(actual)
+            actual = siguiente
+
+    def __len__(self):
+        return self.num_palabras
+
+    def __iter__(self):
+        """Recorre las hojas enlazadas en orden ascendente."""
+        num = self.raiz
+        pagina = self._leer(num)
+        while isinstance(pagina, _Interna):
+            num = pagina.hijos[0]
+            pagina = self._leer(num)
+        while num:
+            hoja = self._leer(num)
+            for clave, valor in list(zip(hoja.claves, hoja.valores)):
+                yield (clave.decode("utf-8"), self._leer_postings(valor))
+            num = hoja.siguiente
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    ruta = os.path.join(tempfile.gettempdir(), "demo_indice.btx")
+    if os.path.exists(ruta):
+        os.remove(ruta)
+
+    with BTreeDisco(ruta) as indice:
+        for i, p in enumerate(["perro", "gato", "casa", "arbol", "zorro", "perro"]):
+            indice.insertar(p, 1, i + 1)
+        indice.eliminar("casa")
+
+    # Reabrir: solo se lee la cabecera, las páginas se cargan bajo demanda
+    with BTreeDisco(ruta) as indice:
+        print("Búsqueda 'perro':", indice.buscar("perro"))
+        print("Inorden:", indice.inorden())
+    os.remove(ruta)
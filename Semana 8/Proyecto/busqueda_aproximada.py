@@ -0,0 +1,125 @@
+def distancia_edicion(a, b):
+    """Distancia de Levenshtein (inserciones, borrados y sustituciones)."""
+    if len(a) < len(b):
+        a, b = b, a
+    anterior = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        actual = [i]
+        for j, cb in enumerate(b, 1):
+            actual.append(min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + (ca != cb)))
+        anterior = actual
+    return anterior[-1]
+
+class NodoBK:
+    __slots__ = ("palabra", "hijos")
+
+    def __init__(self, palabra):
+        self.palabra = palabra
+        self.hijos = {}  # Distancia a esta palabra -> hijo
+
+class ArbolBK:
+    """
+    Árbol BK sobre la distancia de edición. Por la desigualdad triangular,
+    si la consulta está a distancia d de un nodo solo pueden haber
+    coincidencias en los hijos con distancia entre d - max_dist y
+    d + max_dist, así que la búsqueda descarta la mayor parte del vocabulario.
+    """
+
+    def __init__(self, palabras=()):
+        self.raiz = None
+        for palabra in palabras:
+            self.agregar(palabra)
+
+    def agregar(self, palabra):
+        if self.raiz is None:
+            self.raiz = NodoBK(palabra)
+            return
+        nodo = self.raiz
+        while True:
+            d = distancia_edicion(palabra, nodo.palabra)
+            if d == 0:
+                return
+            hijo = nodo.hijos.get(d)
+            if hijo is None:
+                nodo.hijos[d] = NodoBK(palabra)
+                return
+            nodo = hijo
+
+    def buscar(self, palabra, max_dist):
+        """Lista de (distancia, palabra) a distancia <= max_dist."""
+        if self.raiz is None:
+            return []
+        encontradas = []
+        pila = [self.raiz]
+        while pila:
+            nodo = pila.pop()
+            d = distancia_edicion(palabra, nodo.palabra)
+            if d <= max_dist:
+                encontradas.append((d, nodo.palabra))
+            for distancia, hijo in nodo.hijos.items():
+                if d - max_dist <= distancia <= d + max_dist:
+                    pila.append(hijo)
+        return encontradas
+
+class IndiceAproximado:
+    """
+    Búsqueda tolerante a errores delante de cualquier índice (BST, AVL, ...).
+    El vocabulario del índice se organiza en un árbol BK y las posiciones de
+    las palabras cercanas se piden al índice. insertar/eliminar se reenvían
+    al índice; las palabras eliminadas quedan en el árbol BK pero se filtran.
+    """
+
+    def __init__(self, indice):
+        self.indice = indice
+        self.bk = ArbolBK(palabra for palabra, _ in indice)
+
+    def buscar(self, palabra):
+        return self.indice.buscar(palabra)
+
+    def buscar_aproximado(self, palabra, max_dist=1):
+        """
+        Retorna una lista de (palabra, distancia, posiciones) con las palabras
+        a distancia de edición <= max_dist, de la más cercana a la más lejana.
+        """
+        resultados = []
+        for d, encontrada in sorted(self.bk.buscar(palabra, max_dist)):
+            posiciones = self.indice.buscar(encontrada)
+            if posiciones:
+                resultados.append((encontrada, d, posiciones))
+        return resultados
+
+    def insertar(self, palabra, linea, columna):
+        self.indice.insertar(palabra, linea, columna)
+        self.bk.agregar(palabra)
+
+    def eliminar(self, palabra):
+        self.indice.eliminar(palabra)
+
+    def inorden(self):
+        return self.indice.inorden()
+
+    def __iter__(self):
+        return iter(self.indice)
+
+if __name__ == "__main__":
+    import time
+    from avl import AVL
+    from tokenizador import tokens_de_archivo
+
+    avl = AVL()
+    for palabra, linea, columna in tokens_de_archivo("test_data.txt"):
+        avl.insertar(palabra, linea, columna)
+    aproximado = IndiceAproximado(avl)
+
+    consulta = "caballera"
+    inicio = time.perf_counter()
+    resultados = aproximado.buscar_aproximado(consulta, 2)
+    t_bk = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    recorrido = [p for p, _ in avl if distancia_edicion(consulta, p) <= 2]
+    t_recorrido = time.perf_counter() - inicio
+
+    print(f"Cercanas a '{consulta}':", [(p, d) for p, d, _ in resultados])
+    print(f"Árbol BK: {t_bk * 1000:.3f} ms, recorrido completo: {t_recorrido * 1000:.3f} ms "
+          f"({len(recorrido)} coincidencias)")
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+_AUSENTE = object()
+
+class IndiceConCache:
+    """
+    Caché LRU acotada delante de cualquier índice (BST, AVL, ...).
+    Las búsquedas repetidas de palabras frecuentes se responden en O(1)
+    sin recorrer el árbol. También se guardan los resultados negativos (None).
+    insertar/eliminar invalidan la entrada de la palabra modificada.
+    """
+
+    def __init__(self, indice, capacidad=1024):
+        self.indice = indice
+        self.capacidad = capacidad
+        self._cache = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def buscar(self, palabra):
+        posiciones = self._cache.get(palabra, _AUSENTE)
+        if posiciones is not _AUSENTE:
+            self._cache.move_to_end(palabra)
+            self.aciertos += 1
+            return posiciones
+        self.fallos += 1
+        posiciones = self.indice.buscar(palabra)
+        self._cache[palabra] = posiciones
+        if len(self._cache) > self.capacidad:
+            self._cache.popitem(last=False)
+        return posiciones
+
+    def insertar(self, palabra, linea, columna):
+        self.indice.insertar(palabra, linea, columna)
+        self._cache.pop(palabra, None)
+
+    def eliminar(self, palabra):
+        self.indice.eliminar(palabra)
+        self._cache.pop(palabra, None)
+
+    def eliminar_posiciones(self, palabra, posiciones):
+        self._cache.pop(palabra, None)
+        return self.indice.eliminar_posiciones(palabra, posiciones)
+
+    def inorden(self):
+        return self.indice.inorden()
+
+    def __iter__(self):
+        return iter(self.indice)
+
+    def limpiar(self):
+        """Vacía la caché y reinicia las estadísticas."""
+        self._cache.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            "entradas": len(self._cache),
+        }
+
+if __name__ == "__main__":
+    import random
+    from avl import AVL
+    from tokenizador import tokens_de_archivo
+
+    avl = AVL()
+    for palabra, linea, columna in tokens_de_archivo("test_data.txt"):
+        avl.insertar(palabra, linea, columna)
+
+    # Consultas con distribución tipo Zipf sobre el vocabulario
+    vocabulario = [p for p, _ in sorted(avl, key=lambda item: -len(item[1]))]
+    pesos = [1 / (i + 1) for i in range(len(vocabulario))]
+    consultas = random.Random(0).choices(vocabulario, weights=pesos, k=10000)
+
+    cache = IndiceConCache(avl, capacidad=64)
+    for p in consultas:
+        cache.buscar(p)
+    print("Estadísticas de la caché:", cache.estadisticas())
@@ -0,0 +1,47 @@
+class DiccionarioPerezoso:
+    """
+    Índice sobre un dict: inserción y búsqueda en O(1) promedio.
+    El orden solo se calcula al recorrer (inorden/__iter__) y se reutiliza
+    mientras no se agreguen ni eliminen palabras.
+    Misma interfaz que BST/AVL.
+    """
+
+    def __init__(self):
+        self.indice = {}
+        self._orden = None  # Lista ordenada de palabras, None si está desactualizada
+
+    def insertar(self, palabra, linea, columna):
+        """Inserta una palabra o agrega una nueva posición si ya existe."""
+        posiciones = self.indice.get(palabra)
+        if posiciones is None:
+            self.indice[palabra] = [(linea, columna)]
+            self._orden = None
+        else:
+            posiciones.append((linea, columna))
+
+    def buscar(self, palabra):
+        """Busca una palabra y retorna sus posiciones o None."""
+        return self.indice.get(palabra)
+
+    def eliminar(self, palabra):
+        """Elimina una palabra del índice."""
+        if self.indice.pop(palabra, None) is not None:
+            self._orden = None
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+    def __iter__(self):
+        if self._orden is None:
+            self._orden = sorted(self.indice)
+        for palabra in self._orden:
+            yield (palabra, self.indice[palabra])
+
+if __name__ == "__main__":
+    indice = DiccionarioPerezoso()
+    palabras = ["perro", "gato", "casa", "arbol", "zorro", "perro"]
+    for i, p in enumerate(palabras):
+        indice.insertar(p, 1, i + 1)
+    indice.eliminar("casa")
+    print("Inorden:", indice.inorden())
@@ -4,50 +4,38 @@ import sys
 from bst import BST
 from avl import AVL
 from huffman import Huffman
+from tokenizador import tokens_de_archivo
+from benchmark import medir, resumen
 
-def cargar_archivo(ruta):
-    try:
-        with open(ruta, 'r', encoding='utf-8') as f:
-            contenido = f.readlines()
-        return contenido
-    except FileNotFoundError:
-        print(f"Error: El archivo '{ruta}' no existe.")
-        return None
-
-def procesar_texto(lineas):
-    palabras_procesadas = []
-    for num_linea, linea in enumerate(lineas, 1):
-        # Limpieza básica: quitar signos de puntuación y convertir a minúsculas
-        palabras = linea.lower().replace('.', '').replace(',', '').replace('?', '').replace('!', '').replace(';', '').replace(':', '').replace('"', '').replace('(', '').replace(')', '').split()
-        for num_col, palabra in enumerate(palabras, 1):
-            palabras_procesadas.append((palabra, num_linea, num_col))
-    return palabras_procesadas
-
-def medir_construccion(palabras_procesadas):
+def medir_construccion(ruta):
     bst = BST()
     avl = AVL()
     
     # Medir tiempo BST
-    inicio = time.time()
-    for palabra, linea, col in palabras_procesadas:
+    inicio = time.perf_counter()
+    for palabra, linea, col in tokens_de_archivo(ruta):
         bst.insertar(palabra, linea, col)
-    fin = time.time()
+    fin = time.perf_counter()
     tiempo_bst = (fin - inicio) * 1000
     
     # Medir tiempo AVL
-    inicio = time.time()
-    for palabra, linea, col in palabras_procesadas:
+    inicio = time.perf_counter()
+    for palabra, linea, col in tokens_de_archivo(ruta):
         avl.insertar(palabra, linea, col)
-    fin = time.time()
+    fin = time.perf_counter()
     tiempo_avl = (fin - inicio) * 1000
     
     return bst, avl, tiempo_bst, tiempo_avl
 
 def medir_busqueda(arbol, palabra):
-    inicio = time.time()
-    arbol.buscar(palabra)
-    fin = time.time()
-    return (fin - inicio) * 1000
+    # Mediana de varias repeticiones en lotes: una sola búsqueda dura menos
+    # que la resolución del reloj
+    muestras = medir(lambda: arbol.buscar(palabra), repeticiones=50, lote=100)
+    return resumen(muestras)["p50"] / 1e6
+
+def medir_busqueda_lote(arbol, palabras):
+    muestras = medir(lambda: arbol.buscar_muchos(palabras), repeticiones=20)
+    return resumen(muestras)["p50"] / 1e6
 
 def medir_huffman(ruta_entrada):
     huffman = Huffman()
@@ -76,12 +64,8 @@ def main():
 
     print("=== GENERANDO DATOS PARA EL REPORTE ===")
     
-    # 1. Carga y Procesamiento
-    contenido = cargar_archivo(ruta_archivo)
-    datos = procesar_texto(contenido)
-    
-    # 2. Construcción
-    bst, avl, t_bst, t_avl = medir_construccion(datos)
+    # 1-2. Carga, procesamiento y construcción (flujo de tokens)
+    bst, avl, t_bst, t_avl = medir_construccion(ruta_archivo)
     
     print("\n--- Tiempos de Construcción ---")
     print(f"BST: {t_bst:.4f} ms")
@@ -100,6 +84,12 @@ def main():
         t_b = medir_busqueda(bst, p)
         t_a = medir_busqueda(avl, p)
         print(f"{p:<15} | {t_b:.6f}   | {t_a:.6f}")
+    
+    # Todas las palabras del texto, buscadas una a una y en lote
+    vocabulario = [p for p, _ in avl]
+    t_uno_a_uno = sum(medir_busqueda(avl, p) for p in vocabulario)
+    t_lote = medir_busqueda_lote(avl, vocabulario)
+    print(f"\nAVL, {len(vocabulario)} palabras una a una: {t_uno_a_uno:.4f} ms | en lote: {t_lote:.4f} ms")
 
     # 4. Huffman
     size_orig, size_comp, ahorro = medir_huffman(ruta_archivo)
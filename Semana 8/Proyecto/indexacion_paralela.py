@@ -0,0 +1,131 @@
+import heapq
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from avl import AVL
+from tokenizador import tokenizar
+
+def _fin_de_linea(f, posicion):
+    """
+    Posición justo después del primer fin de línea ('\n', '\r' o '\r\n')
+    desde posicion, o el final del archivo. Son los mismos saltos que
+    reconoce la lectura en modo texto de tokenizador.leer_lineas.
+    """
+    f.seek(posicion)
+    while True:
+        bloque = f.read(65536)
+        if not bloque:
+            return posicion
+        saltos = [i for i in (bloque.find(b'\n'), bloque.find(b'\r')) if i >= 0]
+        if saltos:
+            i = min(saltos)
+            posicion += i + 1
+            if bloque[i:i + 1] == b'\r':
+                # Un '\r\n' no se parte entre dos rangos
+                siguiente = bloque[i + 1:i + 2] if i + 1 < len(bloque) else f.read(1)
+                if siguiente == b'\n':
+                    posicion += 1
+            return posicion
+        posicion += len(bloque)
+
+def dividir_en_rangos(ruta, partes):
+    """
+    Divide el archivo en hasta `partes` rangos de bytes [inicio, fin)
+    que siempre terminan al final de una línea.
+    """
+    tam = os.path.getsize(ruta)
+    if tam == 0:
+        return []
+    rangos = []
+    with open(ruta, 'rb') as f:
+        inicio = 0
+        for i in range(1, partes + 1):
+            if inicio >= tam:
+                break
+            objetivo = tam * i // partes
+            if objetivo <= inicio:
+                continue
+            fin = _fin_de_linea(f, objetivo)  # Avanzar hasta el final de la línea actual
+            rangos.append((inicio, fin))
+            inicio = fin
+    return rangos
+
+def _leer_rango(ruta, inicio, fin):
+    with open(ruta, 'rb') as f:
+        f.seek(inicio)
+        return f.read(fin - inicio)
+
+def _contar_lineas(tarea):
+    """Saltos de línea del rango: '\n', '\r' y '\r\n' cuentan uno cada uno."""
+    ruta, inicio, fin = tarea
+    datos = _leer_rango(ruta, inicio, fin)
+    return datos.count(b'\n') + datos.count(b'\r') - datos.count(b'\r\n')
+
+def _indexar_fragmento(tarea):
+    """Indexa un rango del archivo; retorna [(palabra, posiciones)] ordenado."""
+    ruta, inicio, fin, primera_linea = tarea
+    # Saltos universales, como en tokenizador.leer_lineas y _contar_lineas
+    lineas = io.TextIOWrapper(io.BytesIO(_leer_rango(ruta, inicio, fin)), encoding='utf-8')
+    mapa = {}
+    for palabra, linea, columna in tokenizar(lineas):
+        posicion = (linea + primera_linea - 1, columna)
+        posiciones = mapa.get(palabra)
+        if posiciones is None:
+            mapa[palabra] = [posicion]
+        else:
+            posiciones.append(posicion)
+    return sorted(mapa.items())
+
+def fusionar_fragmentos(fragmentos):
+    """
+    Mezcla listas ordenadas de (palabra, posiciones) en una sola.
+    Los fragmentos deben venir en el orden del archivo: heapq.merge es
+    estable, así que las posiciones de cada palabra quedan ordenadas.
+    """
+    fusion = []
+    for palabra, posiciones in heapq.merge(*fragmentos, key=itemgetter(0)):
+        if fusion and fusion[-1][0] == palabra:
+            fusion[-1][1].extend(posiciones)
+        else:
+            fusion.append((palabra, posiciones))
+    return fusion
+
+def _fragmentos(ruta, rangos, mapear):
+    """Cuenta líneas y luego indexa cada rango, con `mapear` secuencial o paralelo."""
+    conteos = list(mapear(_contar_lineas, [(ruta, i, f) for i, f in rangos]))
+    tareas = []
+    primera_linea = 1
+    for (inicio, fin), conteo in zip(rangos, conteos):
+        tareas.append((ruta, inicio, fin, primera_linea))
+        primera_linea += conteo
+    return list(mapear(_indexar_fragmento, tareas))
+
+def construir_avl_paralelo(ruta, procesos=None, partes=None):
+    """
+    Construye el índice AVL de un archivo usando varios procesos:
+    1. divide el archivo en rangos de líneas,
+    2. cuenta las líneas de cada rango para conocer su primera línea,
+    3. tokeniza cada rango en paralelo a un mapa palabra -> posiciones,
+    4. fusiona los fragmentos y carga el AVL con desde_ordenado (O(n)).
+    """
+    procesos = procesos or os.cpu_count() or 1
+    partes = partes or procesos * 4
+    rangos = dividir_en_rangos(ruta, partes)
+
+    if procesos == 1:
+        fragmentos = _fragmentos(ruta, rangos, map)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            fragmentos = _fragmentos(ruta, rangos, ejecutor.map)
+    return AVL.desde_ordenado(fusionar_fragmentos(fragmentos))
+
+if __name__ == "__main__":
+    ruta = sys.argv[1] if len(sys.argv) > 1 else "test_data.txt"
+    inicio = time.perf_counter()
+    avl = construir_avl_paralelo(ruta)
+    fin = time.perf_counter()
+    print(f"Índice AVL de '{ruta}': {len(avl)} palabras distintas")
+    print(f"Tiempo construcción paralela: {(fin - inicio) * 1000:.4f} ms")
@@ -0,0 +1,93 @@
+import difflib
+import hashlib
+import io
+from tokenizador import palabras_de_linea
+
+class IndiceIncremental:
+    """
+    Mantiene un índice (BST/AVL) sincronizado con un archivo sin reconstruirlo.
+    Guarda las líneas ya indexadas y un hash del contenido: si el archivo no
+    cambió no hace nada; si cambió, compara línea a línea y solo quita e
+    inserta las posiciones de las líneas afectadas.
+
+    Las líneas que no cambiaron pero se desplazaron (por líneas agregadas o
+    quitadas antes que ellas) también se reindexan, porque su número de línea
+    forma parte de cada posición.
+    """
+
+    def __init__(self, indice):
+        self.indice = indice
+        self.lineas = []
+        self.hash = None
+
+    def _leer(self, ruta):
+        with open(ruta, 'rb') as f:
+            datos = f.read()
+        return datos, hashlib.sha256(datos).hexdigest()
+
+    def _lineas(self, datos):
+        # Misma separación de líneas que la lectura en modo texto del tokenizador
+        return io.TextIOWrapper(io.BytesIO(datos), encoding='utf-8').readlines()
+
+    def registrar(self, ruta):
+        """Registra el contenido actual de ruta como ya indexado."""
+        datos, self.hash = self._leer(ruta)
+        self.lineas = self._lineas(datos)
+
+    def actualizar(self, ruta):
+        """
+        Lleva el índice al contenido actual de ruta.
+        Retorna (lineas_quitadas, lineas_agregadas) reindexadas; (0, 0) si no hubo cambios.
+        """
+        datos, hash_nuevo = self._leer(ruta)
+        if hash_nuevo == self.hash:
+            return 0, 0
+        nuevas = self._lineas(datos)
+
+        viejas_afectadas = []
+        nuevas_afectadas = []
+        comparador = difflib.SequenceMatcher(None, self.lineas, nuevas, autojunk=False)
+        for operacion, i1, i2, j1, j2 in comparador.get_opcodes():
+            if operacion == 'equal' and i1 == j1:
+                continue
+            viejas_afectadas.extend(range(i1, i2))
+            nuevas_afectadas.extend(range(j1, j2))
+
+        # Quitar las posiciones viejas agrupadas por palabra
+        por_palabra = {}
+        for i in viejas_afectadas:
+            for num_col, palabra in enumerate(palabras_de_linea(self.lineas[i]), 1):
+                por_palabra.setdefault(palabra, []).append((i + 1, num_col))
+        for palabra, posiciones in por_palabra.items():
+            self.indice.eliminar_posiciones(palabra, posiciones)
+
+        tocadas = set()
+        for j in nuevas_afectadas:
+            for num_col, palabra in enumerate(palabras_de_linea(nuevas[j]), 1):
+                self.indice.insertar(palabra, j + 1, num_col)
+                tocadas.add(palabra)
+        # insertar agrega al final; se reordenan solo las listas modificadas
+        for palabra in tocadas:
+            self.indice.buscar(palabra).sort()
+
+        self.lineas = nuevas
+        self.hash = hash_nuevo
+        return len(viejas_afectadas), len(nuevas_afectadas)
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from avl import AVL
+
+    ruta = os.path.join(tempfile.gettempdir(), "demo_incremental.txt")
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write("el perro come\nel gato duerme\nla casa azul\n")
+
+    incremental = IndiceIncremental(AVL())
+    print("Primera carga:", incremental.actualizar(ruta))
+    print("Sin cambios:", incremental.actualizar(ruta))
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write("el perro come\nel gato juega\nla casa azul\n")
+    print("Una línea editada:", incremental.actualizar(ruta))
+    print("Inorden:", incremental.indice.inorden())
+    os.remove(ruta)
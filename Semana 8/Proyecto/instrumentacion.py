@@ -0,0 +1,173 @@
+from bst import BST
+from avl import AVL
+
+class EstadisticasArbol:
+    """Contadores de operaciones de un árbol instrumentado."""
+
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.comparaciones = 0
+        self.nodos_visitados = 0
+        self.nodos_creados = 0
+        self.profundidad_maxima = 0
+        self.rotaciones = {"LL": 0, "RR": 0, "LR": 0, "RL": 0}
+        self._profundidad = 0
+
+    def entrar(self, comparaciones):
+        self.nodos_visitados += 1
+        self.comparaciones += comparaciones
+        self._profundidad += 1
+        if self._profundidad > self.profundidad_maxima:
+            self.profundidad_maxima = self._profundidad
+
+    def salir(self):
+        self._profundidad -= 1
+
+    def como_dict(self):
+        return {
+            "comparaciones": self.comparaciones,
+            "nodos_visitados": self.nodos_visitados,
+            "nodos_creados": self.nodos_creados,
+            "profundidad_maxima": self.profundidad_maxima,
+            "rotaciones": dict(self.rotaciones),
+        }
+
+def _comparaciones_descenso(palabra, nodo):
+    """Comparaciones que hace un paso de inserción/eliminación (< y luego >)."""
+    return 1 if palabra < nodo.palabra else 2
+
+def _comparaciones_busqueda(palabra, nodo):
+    """Comparaciones que hace un paso de búsqueda (== y luego <)."""
+    return 1 if palabra == nodo.palabra else 2
+
+class BSTInstrumentado(BST):
+    """
+    BST que cuenta comparaciones, nodos visitados, nodos creados y
+    profundidad máxima. Las clases BST/AVL no tienen ningún contador:
+    el costo solo existe al usar esta subclase (o instrumentar()).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.estadisticas = EstadisticasArbol()
+
+    def insertar(self, palabra, linea, columna):
+        if not self.raiz:
+            self.estadisticas.nodos_creados += 1
+        super().insertar(palabra, linea, columna)
+
+    def _insertar_recursivo(self, nodo, palabra, linea, columna):
+        e = self.estadisticas
+        e.entrar(_comparaciones_descenso(palabra, nodo))
+        # El BST crea el hijo sin descender a él
+        if palabra < nodo.palabra:
+            e.nodos_creados += nodo.izquierdo is None
+        elif palabra > nodo.palabra:
+            e.nodos_creados += nodo.derecho is None
+        try:
+            return super()._insertar_recursivo(nodo, palabra, linea, columna)
+        finally:
+            e.salir()
+
+    def _buscar_recursivo(self, nodo, palabra):
+        if nodo is None:
+            return None
+        e = self.estadisticas
+        e.entrar(_comparaciones_busqueda(palabra, nodo))
+        try:
+            return super()._buscar_recursivo(nodo, palabra)
+        finally:
+            e.salir()
+
+    def _eliminar_recursivo(self, nodo, palabra):
+        if nodo is None:
+            return None
+        e = self.estadisticas
+        e.entrar(_comparaciones_descenso(palabra, nodo))
+        try:
+            return super()._eliminar_recursivo(nodo, palabra)
+        finally:
+            e.salir()
+
+class AVLInstrumentado(AVL):
+    """AVL que además cuenta las rotaciones por caso (LL, RR, LR, RL)."""
+
+    def __init__(self):
+        super().__init__()
+        self.estadisticas = EstadisticasArbol()
+
+    def _insertar_recursivo(self, nodo, palabra, linea, columna):
+        e = self.estadisticas
+        if not nodo:
+            e.nodos_creados += 1
+            return super()._insertar_recursivo(nodo, palabra, linea, columna)
+        e.entrar(_comparaciones_descenso(palabra, nodo))
+        try:
+            return super()._insertar_recursivo(nodo, palabra, linea, columna)
+        finally:
+            e.salir()
+
+    def _buscar_recursivo(self, nodo, palabra):
+        if nodo is None:
+            return None
+        e = self.estadisticas
+        e.entrar(_comparaciones_busqueda(palabra, nodo))
+        try:
+            return super()._buscar_recursivo(nodo, palabra)
+        finally:
+            e.salir()
+
+    def _eliminar_recursivo(self, nodo, palabra):
+        if not nodo:
+            return None
+        e = self.estadisticas
+        e.entrar(_comparaciones_descenso(palabra, nodo))
+        try:
+            return super()._eliminar_recursivo(nodo, palabra)
+        finally:
+            e.salir()
+
+    def _balancear_LL(self, nodo):
+        self.estadisticas.rotaciones["LL"] += 1
+        return super()._balancear_LL(nodo)
+
+    def _balancear_RR(self, nodo):
+        self.estadisticas.rotaciones["RR"] += 1
+        return super()._balancear_RR(nodo)
+
+    def _balancear_LR(self, nodo):
+        self.estadisticas.rotaciones["LR"] += 1
+        return super()._balancear_LR(nodo)
+
+    def _balancear_RL(self, nodo):
+        self.estadisticas.rotaciones["RL"] += 1
+        return super()._balancear_RL(nodo)
+
+_INSTRUMENTADAS = {BST: BSTInstrumentado, AVL: AVLInstrumentado}
+_ORIGINALES = {v: k for k, v in _INSTRUMENTADAS.items()}
+
+def instrumentar(arbol):
+    """Activa los contadores en un árbol ya construido. Retorna sus estadísticas."""
+    if type(arbol) not in _ORIGINALES:
+        arbol.__class__ = _INSTRUMENTADAS[type(arbol)]
+        arbol.estadisticas = EstadisticasArbol()
+    return arbol.estadisticas
+
+def desinstrumentar(arbol):
+    """Vuelve a la clase original, sin ningún costo de medición."""
+    if type(arbol) in _ORIGINALES:
+        arbol.__class__ = _ORIGINALES[type(arbol)]
+        del arbol.estadisticas
+
+if __name__ == "__main__":
+    from tokenizador import tokens_de_archivo
+
+    for clase in (BSTInstrumentado, AVLInstrumentado):
+        arbol = clase()
+        for palabra, linea, columna in tokens_de_archivo("test_data.txt"):
+            arbol.insertar(palabra, linea, columna)
+        arbol.estadisticas.reiniciar()
+        arbol.buscar("hidalgo")
+        print(f"{clase.__name__} búsqueda 'hidalgo':", arbol.estadisticas.como_dict())
@@ -3,58 +3,71 @@ import os
 import sys
 from bst import BST
 from avl import AVL
+from rojinegro import ArbolRojinegro
+from skiplist import SkipList
+from arreglo_ordenado import ArregloOrdenado
+from diccionario_perezoso import DiccionarioPerezoso
+from splay import ArbolSplay
+from radix import ArbolRadix
 from huffman import Huffman
+from tokenizador import tokens_de_archivo
+from indice_incremental import IndiceIncremental
+
+# Estructuras intercambiables: todas implementan insertar/buscar/eliminar/inorden
+MOTORES = {
+    "BST": BST,
+    "AVL": AVL,
+    "Rojinegro": ArbolRojinegro,
+    "Splay": ArbolSplay,
+    "Radix": ArbolRadix,
+    "Skip list": SkipList,
+    "Arreglo (bisect)": ArregloOrdenado,
+    "Dict + orden": DiccionarioPerezoso,
+}
 
 def limpiar_pantalla():
     os.system('cls' if os.name == 'nt' else 'clear')
 
 def cargar_archivo(ruta):
-    try:
-        with open(ruta, 'r', encoding='utf-8') as f:
-            contenido = f.readlines()
-        return contenido
-    except FileNotFoundError:
+    """
+    Retorna una función que genera un flujo nuevo de tokens del archivo
+    en cada llamada, o None si el archivo no existe.
+    """
+    if not os.path.exists(ruta):
         print(f"Error: El archivo '{ruta}' no existe.")
         return None
+    return lambda: tokens_de_archivo(ruta)
 
-def procesar_texto(lineas):
-    palabras_procesadas = []
-    for num_linea, linea in enumerate(lineas, 1):
-        # Limpieza básica: quitar signos de puntuación y convertir a minúsculas
-        palabras = linea.lower().replace('.', '').replace(',', '').replace('?', '').replace('!', '').split()
-        for num_col, palabra in enumerate(palabras, 1):
-            palabras_procesadas.append((palabra, num_linea, num_col))
-    return palabras_procesadas
-
-def construir_indices(palabras_procesadas):
-    bst = BST()
-    avl = AVL()
+def construir_indices(fuente_tokens, motores=MOTORES):
+    """
+    Construye un índice con cada estructura de `motores` y mide su tiempo.
+    `fuente_tokens` es una función que retorna un flujo nuevo de tuplas
+    (palabra, linea, columna); cada estructura consume el suyo, de modo que
+    los tokens nunca se guardan todos en memoria.
+    Retorna (indices, tiempos), ambos diccionarios por nombre de estructura.
+    """
+    indices = {}
+    tiempos = {}
     
     print("\nConstruyendo índices...")
     
-    # Medir tiempo BST
-    inicio = time.time()
-    for palabra, linea, col in palabras_procesadas:
-        bst.insertar(palabra, linea, col)
-    fin = time.time()
-    tiempo_bst = (fin - inicio) * 1000
-    print(f"Tiempo construcción BST: {tiempo_bst:.4f} ms")
-    
-    # Medir tiempo AVL
-    inicio = time.time()
-    for palabra, linea, col in palabras_procesadas:
-        avl.insertar(palabra, linea, col)
-    fin = time.time()
-    tiempo_avl = (fin - inicio) * 1000
-    print(f"Tiempo construcción AVL: {tiempo_avl:.4f} ms")
+    for nombre, clase in motores.items():
+        indice = clase()
+        inicio = time.perf_counter()
+        for palabra, linea, col in fuente_tokens():
+            indice.insertar(palabra, linea, col)
+        fin = time.perf_counter()
+        indices[nombre] = indice
+        tiempos[nombre] = (fin - inicio) * 1000
+        print(f"Tiempo construcción {nombre}: {tiempos[nombre]:.4f} ms")
     
-    return bst, avl, tiempo_bst, tiempo_avl
+    return indices, tiempos
 
 def buscar_palabra(arbol, nombre_arbol):
     palabra = input(f"\nIngrese palabra a buscar en {nombre_arbol}: ").lower()
-    inicio = time.time()
+    inicio = time.perf_counter()
     resultados = arbol.buscar(palabra)
-    fin = time.time()
+    fin = time.perf_counter()
     
     tiempo = (fin - inicio) * 1000
     
@@ -74,13 +87,14 @@ def buscar_palabra(arbol, nombre_arbol):
 def menu_principal():
     bst = None
     avl = None
+    incrementales = {}  # Nombre -> IndiceIncremental del archivo ya indexado
     ruta_archivo = "test_data.txt" # Por defecto
     huffman = Huffman()
     
     while True:
         print("\n=== PROYECTO FINAL: ESTRUCTURAS DE DATOS ===")
         print(f"Archivo actual: {ruta_archivo}")
-        print("1. Cargar archivo y construir índices (BST vs AVL)")
+        print("1. Cargar archivo y construir índices (comparar estructuras)")
         print("2. Buscar palabra en BST")
         print("3. Buscar palabra en AVL")
         print("4. Comprimir archivo (Huffman)")
@@ -91,24 +105,43 @@ def menu_principal():
         opcion = input("\nSeleccione una opción: ")
         
         if opcion == '1':
-            contenido = cargar_archivo(ruta_archivo)
-            if contenido:
-                datos = procesar_texto(contenido)
-                bst, avl, t_bst, t_avl = construir_indices(datos)
+            fuente_tokens = cargar_archivo(ruta_archivo)
+            if fuente_tokens and incrementales:
+                # Los índices ya existen: solo se aplican los cambios del archivo
+                for nombre, incremental in incrementales.items():
+                    inicio = time.perf_counter()
+                    quitadas, agregadas = incremental.actualizar(ruta_archivo)
+                    fin = time.perf_counter()
+                    if quitadas or agregadas:
+                        print(f"{nombre}: {quitadas} líneas quitadas, {agregadas} agregadas "
+                              f"en {(fin - inicio) * 1000:.4f} ms")
+                    else:
+                        print(f"{nombre}: el archivo no cambió, no se reindexa.")
+            elif fuente_tokens:
+                indices, tiempos = construir_indices(fuente_tokens)
+                bst, avl = indices["BST"], indices["AVL"]
+                t_bst, t_avl = tiempos["BST"], tiempos["AVL"]
                 print(f"\nComparativa:")
-                if t_bst < t_avl:
+                if min(t_bst, t_avl) <= 0:
+                    print("Tiempos demasiado pequeños para comparar.")
+                elif t_bst < t_avl:
                     print(f"BST fue {t_avl/t_bst:.2f}x más rápido en construcción.")
                 else:
                     print(f"AVL fue {t_bst/t_avl:.2f}x más rápido en construcción.")
+                mas_rapido = min(tiempos, key=tiempos.get)
+                print(f"Estructura más rápida en construcción: {mas_rapido}")
+                for nombre, indice in (("BST", bst), ("AVL", avl)):
+                    incrementales[nombre] = IndiceIncremental(indice)
+                    incrementales[nombre].registrar(ruta_archivo)
         
         elif opcion == '2':
-            if bst:
+            if bst is not None:
                 buscar_palabra(bst, "BST")
             else:
                 print("Primero debe cargar el archivo (Opción 1).")
         
         elif opcion == '3':
-            if avl:
+            if avl is not None:
                 buscar_palabra(avl, "AVL")
             else:
                 print("Primero debe cargar el archivo (Opción 1).")
@@ -116,9 +149,9 @@ def menu_principal():
         elif opcion == '4':
             if os.path.exists(ruta_archivo):
                 salida = ruta_archivo.split('.')[0] + ".huff"
-                inicio = time.time()
+                inicio = time.perf_counter()
                 huffman.comprimir_archivo(ruta_archivo, salida)
-                fin = time.time()
+                fin = time.perf_counter()
                 print(f"Tiempo de compresión: {(fin-inicio)*1000:.4f} ms")
             else:
                 print("El archivo no existe.")
@@ -127,9 +160,9 @@ def menu_principal():
             entrada = input("Ingrese nombre del archivo .huff: ")
             if os.path.exists(entrada):
                 salida = entrada.split('.')[0] + "_decomp.txt"
-                inicio = time.time()
+                inicio = time.perf_counter()
                 huffman.descomprimir_archivo(entrada, salida)
-                fin = time.time()
+                fin = time.perf_counter()
                 print(f"Tiempo de descompresión: {(fin-inicio)*1000:.4f} ms")
             else:
                 print("El archivo no existe.")
@@ -140,6 +173,7 @@ def menu_principal():
                 ruta_archivo = nueva_ruta
                 bst = None
                 avl = None
+                incrementales = {}
                 print("Archivo cambiado. Recuerde construir los índices nuevamente.")
             else:
                 print("Archivo no encontrado.")
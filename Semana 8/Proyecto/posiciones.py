@@ -0,0 +1,86 @@
+from array import array
+from itertools import chain
+
+class Posiciones:
+    """
+    Lista compacta de posiciones (línea, columna) de una palabra.
+    Los pares se guardan seguidos en un array de enteros sin signo de 32 bits
+    (8 bytes por posición) en vez de una lista de tuplas (unos 100 bytes por
+    posición entre la tupla, sus enteros y el puntero de la lista). Se usa
+    como una secuencia de tuplas (linea, columna): len, iteración, índices,
+    append/extend y comparación con listas de tuplas. Los caminos críticos
+    (inserción en los árboles, guardar/cargar) usan directamente el array
+    `pares`: linea, columna, linea, columna, ...
+    """
+    __slots__ = ("pares",)
+
+    def __init__(self, pares=()):
+        if isinstance(pares, Posiciones):
+            self.pares = array('I', pares.pares)
+        else:
+            self.pares = array('I', chain.from_iterable(pares))
+
+    @classmethod
+    def de_par(cls, linea, columna):
+        """Posiciones con un único par, sin pasar por una lista intermedia."""
+        posiciones = cls.__new__(cls)
+        posiciones.pares = array('I', (linea, columna))
+        return posiciones
+
+    @classmethod
+    def de_pares(cls, pares):
+        """Envuelve un array 'I' ya intercalado (linea, columna, ...) sin copiarlo."""
+        posiciones = cls.__new__(cls)
+        posiciones.pares = pares
+        return posiciones
+
+    def append(self, par):
+        self.pares.extend(par)
+
+    def extend(self, pares):
+        if isinstance(pares, Posiciones):
+            self.pares.extend(pares.pares)
+        else:
+            self.pares.extend(chain.from_iterable(pares))
+
+    def sort(self):
+        """Ordena las posiciones por (linea, columna), en su lugar."""
+        self.pares = Posiciones(sorted(self)).pares
+
+    def __len__(self):
+        return len(self.pares) // 2
+
+    def __iter__(self):
+        valores = iter(self.pares)
+        return zip(valores, valores)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice de posición fuera de rango")
+        return (self.pares[2 * i], self.pares[2 * i + 1])
+
+    def __setitem__(self, i, pares):
+        # Solo reemplazo completo (posiciones[:] = ...), conservando el objeto
+        if i != slice(None):
+            raise TypeError("Posiciones solo admite asignar posiciones[:]")
+        self.pares = Posiciones(pares).pares
+
+    def __contains__(self, par):
+        return any(p == par for p in self)
+
+    def __eq__(self, otro):
+        if isinstance(otro, Posiciones):
+            return self.pares == otro.pares
+        if isinstance(otro, (list, tuple)):
+            return list(self) == list(otro)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Posiciones({list(self)!r})"
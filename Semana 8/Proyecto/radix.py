@@ -0,0 +1,137 @@
+class NodoRadix:
+    __slots__ = ("etiqueta", "posiciones", "hijos")
+
+    def __init__(self, etiqueta, posiciones=None):
+        self.etiqueta = etiqueta      # Fragmento de palabra en la arista que llega al nodo
+        self.posiciones = posiciones  # None si ninguna palabra termina aquí
+        self.hijos = {}               # Primer carácter de la etiqueta -> hijo
+
+def _prefijo_comun(a, b, inicio):
+    """Largo del prefijo común entre a y b[inicio:]."""
+    limite = min(len(a), len(b) - inicio)
+    i = 0
+    while i < limite and a[i] == b[inicio + i]:
+        i += 1
+    return i
+
+class ArbolRadix:
+    """
+    Árbol radix (trie comprimido) para indexación de texto.
+    Las palabras con prefijo común comparten los nodos de ese prefijo
+    (caballero, caballera, caballeros) y la búsqueda cuesta O(largo de la
+    palabra) sin importar el tamaño del vocabulario. Misma interfaz que BST/AVL.
+    """
+
+    def __init__(self):
+        self.raiz = NodoRadix("")
+
+    def insertar(self, palabra, linea, columna):
+        """Inserta una palabra o agrega una nueva posición si ya existe."""
+        nodo = self.raiz
+        i = 0
+        while i < len(palabra):
+            hijo = nodo.hijos.get(palabra[i])
+            if hijo is None:
+                nodo.hijos[palabra[i]] = NodoRadix(palabra[i:], [(linea, columna)])
+                return
+            comun = _prefijo_comun(hijo.etiqueta, palabra, i)
+            if comun < len(hijo.etiqueta):
+                # Parte la arista: el prefijo común pasa a un nodo intermedio
+                intermedio = NodoRadix(hijo.etiqueta[:comun])
+                hijo.etiqueta = hijo.etiqueta[comun:]
+                intermedio.hijos[hijo.etiqueta[0]] = hijo
+                nodo.hijos[palabra[i]] = intermedio
+                hijo = intermedio
+            nodo = hijo
+            i += comun
+        if nodo.posiciones is None:
+            nodo.posiciones = [(linea, columna)]
+        else:
+            nodo.posiciones.append((linea, columna))
+
+    def _buscar_nodo(self, palabra):
+        nodo = self.raiz
+        i = 0
+        while i < len(palabra):
+            nodo = nodo.hijos.get(palabra[i])
+            if nodo is None or not palabra.startswith(nodo.etiqueta, i):
+                return None
+            i += len(nodo.etiqueta)
+        return nodo
+
+    def buscar(self, palabra):
+        """Busca una palabra y retorna sus posiciones o None."""
+        nodo = self._buscar_nodo(palabra)
+        return nodo.posiciones if nodo else None
+
+    def eliminar(self, palabra):
+        """Elimina una palabra del índice."""
+        camino = [self.raiz]
+        nodo = self.raiz
+        i = 0
+        while i < len(palabra):
+            nodo = nodo.hijos.get(palabra[i])
+            if nodo is None or not palabra.startswith(nodo.etiqueta, i):
+                return
+            camino.append(nodo)
+            i += len(nodo.etiqueta)
+        if nodo.posiciones is None:
+            return
+        nodo.posiciones = None
+
+        # Quita el nodo si quedó sin hijos y luego compacta el padre
+        if len(camino) > 1 and not nodo.hijos:
+            camino.pop()
+            del camino[-1].hijos[nodo.etiqueta[0]]
+            nodo = camino[-1]
+        if nodo is not self.raiz and nodo.posiciones is None and len(nodo.hijos) == 1:
+            (unico,) = nodo.hijos.values()
+            unico.etiqueta = nodo.etiqueta + unico.etiqueta
+            camino[-2].hijos[unico.etiqueta[0]] = unico
+
+    def con_prefijo(self, prefijo):
+        """Genera en orden las tuplas (palabra, posiciones) que empiezan con prefijo."""
+        nodo = self.raiz
+        base = ""
+        i = 0
+        while i < len(prefijo):
+            base = prefijo[:i]
+            nodo = nodo.hijos.get(prefijo[i])
+            if nodo is None:
+                return
+            comun = _prefijo_comun(nodo.etiqueta, prefijo, i)
+            # El prefijo puede terminar a mitad de una etiqueta, pero no diferir de ella
+            if comun < len(nodo.etiqueta) and i + comun < len(prefijo):
+                return
+            i += len(nodo.etiqueta)
+        yield from self._recorrer(nodo, base)
+
+    def _recorrer(self, inicio, base):
+        """Recorrido en orden desde inicio; base es la palabra hasta su padre."""
+        pila = [(inicio, base)]
+        while pila:
+            nodo, base = pila.pop()
+            palabra = base + nodo.etiqueta
+            if nodo.posiciones is not None:
+                yield (palabra, nodo.posiciones)
+            # Los hijos se apilan de mayor a menor para salir en orden
+            for letra in sorted(nodo.hijos, reverse=True):
+                pila.append((nodo.hijos[letra], palabra))
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+    def __iter__(self):
+        return self._recorrer(self.raiz, "")
+
+if __name__ == "__main__":
+    radix = ArbolRadix()
+    palabras = ["caballero", "caballera", "caballeros", "casa", "caballo", "caballero"]
+    for i, p in enumerate(palabras):
+        radix.insertar(p, 1, i + 1)
+
+    print("Inorden:", radix.inorden())
+    print("Prefijo 'caballer':", [p for p, _ in radix.con_prefijo("caballer")])
+    radix.eliminar("caballera")
+    print("Después de eliminar 'caballera':", radix.inorden())
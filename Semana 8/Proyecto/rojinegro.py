@@ -0,0 +1,245 @@
+class NodoRN:
+    __slots__ = ("palabra", "posiciones", "izquierdo", "derecho", "padre", "rojo")
+
+    def __init__(self, palabra, linea, columna, nulo):
+        self.palabra = palabra
+        self.posiciones = [(linea, columna)]
+        self.izquierdo = nulo
+        self.derecho = nulo
+        self.padre = nulo
+        self.rojo = True
+
+class ArbolRojinegro:
+    """
+    Árbol rojinegro (versión clásica con centinela nulo) para indexación de texto.
+    Cada inserción hace a lo sumo 2 rotaciones y cada eliminación a lo sumo 3.
+    Misma interfaz que BST/AVL.
+    """
+
+    def __init__(self):
+        # Centinela compartido: siempre negro, hace de hoja en todo el árbol
+        self.nulo = NodoRN(None, 0, 0, None)
+        self.nulo.rojo = False
+        self.nulo.posiciones = []
+        self.raiz = self.nulo
+
+    def rotacion_izquierda(self, x):
+        y = x.derecho
+        x.derecho = y.izquierdo
+        if y.izquierdo is not self.nulo:
+            y.izquierdo.padre = x
+        y.padre = x.padre
+        if x.padre is self.nulo:
+            self.raiz = y
+        elif x is x.padre.izquierdo:
+            x.padre.izquierdo = y
+        else:
+            x.padre.derecho = y
+        y.izquierdo = x
+        x.padre = y
+
+    def rotacion_derecha(self, x):
+        y = x.izquierdo
+        x.izquierdo = y.derecho
+        if y.derecho is not self.nulo:
+            y.derecho.padre = x
+        y.padre = x.padre
+        if x.padre is self.nulo:
+            self.raiz = y
+        elif x is x.padre.derecho:
+            x.padre.derecho = y
+        else:
+            x.padre.izquierdo = y
+        y.derecho = x
+        x.padre = y
+
+    def insertar(self, palabra, linea, columna):
+        """Inserta una palabra o agrega una nueva posición si ya existe."""
+        padre = self.nulo
+        actual = self.raiz
+        while actual is not self.nulo:
+            padre = actual
+            if palabra < actual.palabra:
+                actual = actual.izquierdo
+            elif palabra > actual.palabra:
+                actual = actual.derecho
+            else:
+                actual.posiciones.append((linea, columna))
+                return
+
+        nodo = NodoRN(palabra, linea, columna, self.nulo)
+        nodo.padre = padre
+        if padre is self.nulo:
+            self.raiz = nodo
+        elif palabra < padre.palabra:
+            padre.izquierdo = nodo
+        else:
+            padre.derecho = nodo
+        self._arreglar_insercion(nodo)
+
+    def _arreglar_insercion(self, z):
+        while z.padre.rojo:
+            abuelo = z.padre.padre
+            if z.padre is abuelo.izquierdo:
+                tio = abuelo.derecho
+                if tio.rojo:
+                    # Recoloreo, el problema sube dos niveles
+                    z.padre.rojo = False
+                    tio.rojo = False
+                    abuelo.rojo = True
+                    z = abuelo
+                else:
+                    if z is z.padre.derecho:
+                        z = z.padre
+                        self.rotacion_izquierda(z)
+                    z.padre.rojo = False
+                    z.padre.padre.rojo = True
+                    self.rotacion_derecha(z.padre.padre)
+            else:
+                tio = abuelo.izquierdo
+                if tio.rojo:
+                    z.padre.rojo = False
+                    tio.rojo = False
+                    abuelo.rojo = True
+                    z = abuelo
+                else:
+                    if z is z.padre.izquierdo:
+                        z = z.padre
+                        self.rotacion_derecha(z)
+                    z.padre.rojo = False
+                    z.padre.padre.rojo = True
+                    self.rotacion_izquierda(z.padre.padre)
+        self.raiz.rojo = False
+
+    def _buscar_nodo(self, palabra):
+        actual = self.raiz
+        while actual is not self.nulo:
+            if palabra == actual.palabra:
+                return actual
+            elif palabra < actual.palabra:
+                actual = actual.izquierdo
+            else:
+                actual = actual.derecho
+        return None
+
+    def buscar(self, palabra):
+        """Busca una palabra y retorna sus posiciones o None."""
+        nodo = self._buscar_nodo(palabra)
+        return nodo.posiciones if nodo else None
+
+    def _trasplantar(self, u, v):
+        if u.padre is self.nulo:
+            self.raiz = v
+        elif u is u.padre.izquierdo:
+            u.padre.izquierdo = v
+        else:
+            u.padre.derecho = v
+        v.padre = u.padre
+
+    def _encontrar_minimo(self, nodo):
+        while nodo.izquierdo is not self.nulo:
+            nodo = nodo.izquierdo
+        return nodo
+
+    def eliminar(self, palabra):
+        """Elimina una palabra del índice."""
+        z = self._buscar_nodo(palabra)
+        if z is None:
+            return
+
+        y = z
+        y_era_rojo = y.rojo
+        if z.izquierdo is self.nulo:
+            x = z.derecho
+            self._trasplantar(z, z.derecho)
+        elif z.derecho is self.nulo:
+            x = z.izquierdo
+            self._trasplantar(z, z.izquierdo)
+        else:
+            y = self._encontrar_minimo(z.derecho)
+            y_era_rojo = y.rojo
+            x = y.derecho
+            if y.padre is z:
+                x.padre = y
+            else:
+                self._trasplantar(y, y.derecho)
+                y.derecho = z.derecho
+                y.derecho.padre = y
+            self._trasplantar(z, y)
+            y.izquierdo = z.izquierdo
+            y.izquierdo.padre = y
+            y.rojo = z.rojo
+
+        if not y_era_rojo:
+            self._arreglar_eliminacion(x)
+
+    def _arreglar_eliminacion(self, x):
+        while x is not self.raiz and not x.rojo:
+            if x is x.padre.izquierdo:
+                w = x.padre.derecho
+                if w.rojo:
+                    w.rojo = False
+                    x.padre.rojo = True
+                    self.rotacion_izquierda(x.padre)
+                    w = x.padre.derecho
+                if not w.izquierdo.rojo and not w.derecho.rojo:
+                    w.rojo = True
+                    x = x.padre
+                else:
+                    if not w.derecho.rojo:
+                        w.izquierdo.rojo = False
+                        w.rojo = True
+                        self.rotacion_derecha(w)
+                        w = x.padre.derecho
+                    w.rojo = x.padre.rojo
+                    x.padre.rojo = False
+                    w.derecho.rojo = False
+                    self.rotacion_izquierda(x.padre)
+                    x = self.raiz
+            else:
+                w = x.padre.izquierdo
+                if w.rojo:
+                    w.rojo = False
+                    x.padre.rojo = True
+                    self.rotacion_derecha(x.padre)
+                    w = x.padre.izquierdo
+                if not w.derecho.rojo and not w.izquierdo.rojo:
+                    w.rojo = True
+                    x = x.padre
+                else:
+                    if not w.izquierdo.rojo:
+                        w.derecho.rojo = False
+                        w.rojo = True
+                        self.rotacion_izquierda(w)
+                        w = x.padre.izquierdo
+                    w.rojo = x.padre.rojo
+                    x.padre.rojo = False
+                    w.izquierdo.rojo = False
+                    self.rotacion_derecha(x.padre)
+                    x = self.raiz
+        x.rojo = False
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+    def __iter__(self):
+        pila = []
+        actual = self.raiz
+        while pila or actual is not self.nulo:
+            while actual is not self.nulo:
+                pila.append(actual)
+                actual = actual.izquierdo
+            actual = pila.pop()
+            yield (actual.palabra, actual.posiciones)
+            actual = actual.derecho
+
+if __name__ == "__main__":
+    rn = ArbolRojinegro()
+    palabras = ["perro", "gato", "casa", "arbol", "zorro", "perro"]
+    for i, p in enumerate(palabras):
+        rn.insertar(p, 1, i + 1)
+
+    print("Inorden:", rn.inorden())
+    rn.eliminar("gato")
+    print("Después de eliminar 'gato':", rn.inorden())
@@ -0,0 +1,104 @@
+import random
+
+MAX_NIVEL = 32
+PROBABILIDAD = 0.25
+
+class NodoSkip:
+    __slots__ = ("palabra", "posiciones", "siguientes")
+
+    def __init__(self, palabra, linea, columna, nivel):
+        self.palabra = palabra
+        self.posiciones = [(linea, columna)]
+        self.siguientes = [None] * nivel  # Un enlace por nivel
+
+class SkipList:
+    """
+    Skip list para indexación de texto.
+    Búsqueda, inserción y eliminación en O(log n) esperado, sin rotaciones.
+    Misma interfaz que BST/AVL.
+    """
+
+    def __init__(self, semilla=None):
+        self.cabeza = NodoSkip(None, 0, 0, MAX_NIVEL)
+        self.cabeza.posiciones = []
+        self.nivel = 1
+        self._azar = random.Random(semilla)
+
+    def _nivel_aleatorio(self):
+        nivel = 1
+        while nivel < MAX_NIVEL and self._azar.random() < PROBABILIDAD:
+            nivel += 1
+        return nivel
+
+    def _predecesores(self, palabra):
+        """Último nodo con palabra menor en cada nivel."""
+        actualizar = [self.cabeza] * MAX_NIVEL
+        actual = self.cabeza
+        for i in range(self.nivel - 1, -1, -1):
+            siguiente = actual.siguientes[i]
+            while siguiente is not None and siguiente.palabra < palabra:
+                actual = siguiente
+                siguiente = actual.siguientes[i]
+            actualizar[i] = actual
+        return actualizar
+
+    def insertar(self, palabra, linea, columna):
+        """Inserta una palabra o agrega una nueva posición si ya existe."""
+        actualizar = self._predecesores(palabra)
+        candidato = actualizar[0].siguientes[0]
+        if candidato is not None and candidato.palabra == palabra:
+            candidato.posiciones.append((linea, columna))
+            return
+
+        nivel = self._nivel_aleatorio()
+        if nivel > self.nivel:
+            self.nivel = nivel
+        nodo = NodoSkip(palabra, linea, columna, nivel)
+        for i in range(nivel):
+            nodo.siguientes[i] = actualizar[i].siguientes[i]
+            actualizar[i].siguientes[i] = nodo
+
+    def buscar(self, palabra):
+        """Busca una palabra y retorna sus posiciones o None."""
+        actual = self.cabeza
+        for i in range(self.nivel - 1, -1, -1):
+            siguiente = actual.siguientes[i]
+            while siguiente is not None and siguiente.palabra < palabra:
+                actual = siguiente
+                siguiente = actual.siguientes[i]
+        actual = actual.siguientes[0]
+        if actual is not None and actual.palabra == palabra:
+            return actual.posiciones
+        return None
+
+    def eliminar(self, palabra):
+        """Elimina una palabra del índice."""
+        actualizar = self._predecesores(palabra)
+        nodo = actualizar[0].siguientes[0]
+        if nodo is None or nodo.palabra != palabra:
+            return
+        for i in range(len(nodo.siguientes)):
+            actualizar[i].siguientes[i] = nodo.siguientes[i]
+        while self.nivel > 1 and self.cabeza.siguientes[self.nivel - 1] is None:
+            self.nivel -= 1
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+    def __iter__(self):
+        actual = self.cabeza.siguientes[0]
+        while actual is not None:
+            yield (actual.palabra, actual.posiciones)
+            actual = actual.siguientes[0]
+
+if __name__ == "__main__":
+    skip = SkipList(semilla=1)
+    palabras = ["perro", "gato", "casa", "arbol", "zorro", "perro"]
+    for i, p in enumerate(palabras):
+        skip.insertar(p, 1, i + 1)
+
+    print("Inorden:", skip.inorden())
+    print("Búsqueda 'perro':", skip.buscar("perro"))
+    skip.eliminar("perro")
+    print("Después de eliminar 'perro':", skip.inorden())
@@ -0,0 +1,135 @@
+class NodoSplay:
+    __slots__ = ("palabra", "posiciones", "izquierdo", "derecho")
+
+    def __init__(self, palabra, linea, columna):
+        self.palabra = palabra
+        self.posiciones = [(linea, columna)]
+        self.izquierdo = None
+        self.derecho = None
+
+class ArbolSplay:
+    """
+    Árbol splay (auto-ajustable) para indexación de texto.
+    Cada acceso sube la palabra buscada a la raíz, de modo que las palabras
+    consultadas con frecuencia quedan cerca de la raíz. Costo amortizado
+    O(log n) por operación. Misma interfaz que AVL.
+    """
+
+    def __init__(self):
+        self.raiz = None
+
+    def _splay(self, palabra):
+        """
+        Splay descendente: reorganiza el árbol dejando en la raíz la palabra
+        buscada, o la última palabra visitada si no existe.
+        """
+        t = self.raiz
+        if t is None:
+            return
+        cabecera = NodoSplay(None, 0, 0)
+        # Árbol de menores en cabecera.derecho, de mayores en cabecera.izquierdo
+        maximo_izq = minimo_der = cabecera
+        while True:
+            if palabra < t.palabra:
+                if t.izquierdo is None:
+                    break
+                if palabra < t.izquierdo.palabra:
+                    # zig-zig: rotación derecha
+                    y = t.izquierdo
+                    t.izquierdo = y.derecho
+                    y.derecho = t
+                    t = y
+                    if t.izquierdo is None:
+                        break
+                minimo_der.izquierdo = t
+                minimo_der = t
+                t = t.izquierdo
+            elif palabra > t.palabra:
+                if t.derecho is None:
+                    break
+                if palabra > t.derecho.palabra:
+                    # zag-zag: rotación izquierda
+                    y = t.derecho
+                    t.derecho = y.izquierdo
+                    y.izquierdo = t
+                    t = y
+                    if t.derecho is None:
+                        break
+                maximo_izq.derecho = t
+                maximo_izq = t
+                t = t.derecho
+            else:
+                break
+        maximo_izq.derecho = t.izquierdo
+        minimo_der.izquierdo = t.derecho
+        t.izquierdo = cabecera.derecho
+        t.derecho = cabecera.izquierdo
+        self.raiz = t
+
+    def insertar(self, palabra, linea, columna):
+        """Inserta una palabra o agrega una nueva posición si ya existe."""
+        if self.raiz is None:
+            self.raiz = NodoSplay(palabra, linea, columna)
+            return
+        self._splay(palabra)
+        raiz = self.raiz
+        if palabra == raiz.palabra:
+            raiz.posiciones.append((linea, columna))
+            return
+        nodo = NodoSplay(palabra, linea, columna)
+        if palabra < raiz.palabra:
+            nodo.izquierdo = raiz.izquierdo
+            nodo.derecho = raiz
+            raiz.izquierdo = None
+        else:
+            nodo.derecho = raiz.derecho
+            nodo.izquierdo = raiz
+            raiz.derecho = None
+        self.raiz = nodo
+
+    def buscar(self, palabra):
+        """Busca una palabra y retorna sus posiciones o None (la sube a la raíz)."""
+        self._splay(palabra)
+        if self.raiz is not None and self.raiz.palabra == palabra:
+            return self.raiz.posiciones
+        return None
+
+    def eliminar(self, palabra):
+        """Elimina una palabra del índice."""
+        self._splay(palabra)
+        raiz = self.raiz
+        if raiz is None or raiz.palabra != palabra:
+            return
+        if raiz.izquierdo is None:
+            self.raiz = raiz.derecho
+        else:
+            derecho = raiz.derecho
+            self.raiz = raiz.izquierdo
+            # palabra es mayor que todo el subárbol izquierdo: sube su máximo
+            self._splay(palabra)
+            self.raiz.derecho = derecho
+
+    def inorden(self):
+        """Retorna una lista de tuplas (palabra, posiciones) ordenada."""
+        return list(self)
+
+    def __iter__(self):
+        pila = []
+        actual = self.raiz
+        while pila or actual:
+            while actual:
+                pila.append(actual)
+                actual = actual.izquierdo
+            actual = pila.pop()
+            yield (actual.palabra, actual.posiciones)
+            actual = actual.derecho
+
+if __name__ == "__main__":
+    splay = ArbolSplay()
+    palabras = ["perro", "gato", "casa", "arbol", "zorro", "perro"]
+    for i, p in enumerate(palabras):
+        splay.insertar(p, 1, i + 1)
+
+    print("Inorden:", splay.inorden())
+    splay.buscar("casa")
+    print("Raíz tras buscar 'casa':", splay.raiz.palabra)
@@ -0,0 +1,446 @@
+import os
+import random
+import tempfile
+import threading
+import unittest
+from bst import BST
+from avl import AVL
+from btree_disco import BTreeDisco
+from rojinegro import ArbolRojinegro
+from skiplist import SkipList
+from arreglo_ordenado import ArregloOrdenado
+from diccionario_perezoso import DiccionarioPerezoso
+from splay import ArbolSplay
+from radix import ArbolRadix
+from avl_persistente import AVLPersistente
+from busqueda_aproximada import IndiceAproximado, distancia_edicion
+from tokenizador import tokenizar, tokens_de_archivo
+from indexacion_paralela import construir_avl_paralelo
+from indice_incremental import IndiceIncremental
+from cache_indice import IndiceConCache
+from instrumentacion import AVLInstrumentado, BSTInstrumentado, instrumentar, desinstrumentar
+from posiciones import Posiciones
+from benchmark import altura_de, generar_claves, medir_estructura, resumen
+from main import MOTORES as MOTORES_MAIN
+
+DATOS_PRUEBA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data.txt")
+
+MOTORES = (BST, AVL, ArbolRojinegro, ArbolSplay, ArbolRadix, SkipList, ArregloOrdenado, DiccionarioPerezoso)
+
+PALABRAS = ["perro", "gato", "casa", "arbol", "zorro", "perro", "mesa", "libro", "gato"]
+
+class TestIndices(unittest.TestCase):
+
+    def construir(self, clase, palabras=PALABRAS):
+        arbol = clase()
+        for i, p in enumerate(palabras):
+            arbol.insertar(p, 1, i + 1)
+        return arbol
+
+    def test_iteradores(self):
+        """Los iteradores recorren el mismo orden que inorden()"""
+        for clase in (BST, AVL):
+            arbol = self.construir(clase)
+            esperado = sorted(set(PALABRAS))
+            self.assertEqual([p for p, _ in arbol], esperado)
+            self.assertEqual([p for p, _ in arbol.iter_inverso()], esperado[::-1])
+            self.assertEqual([p for p, _ in arbol.iter_desde("gato")], esperado[2:])
+            self.assertEqual([p for p, _ in arbol.iter_desde("h")], esperado[3:])
+            self.assertEqual(list(arbol.iter_desde("zz")), [])
+            self.assertEqual(arbol.inorden(), list(arbol))
+
+    def test_iterador_degenerado(self):
+        """Un BST degenerado (entrada ordenada) se recorre con pila explícita"""
+        palabras = [f"p{i:05d}" for i in range(500)]
+        arbol = BST()
+        for p in palabras:
+            arbol.insertar(p, 1, 1)
+        self.assertEqual(next(iter(arbol))[0], "p00000")
+        self.assertEqual([p for p, _ in arbol.iter_desde("p00498")], palabras[-2:])
+
+    def test_estadisticas_de_orden(self):
+        """rank/select/contar_rango coinciden con el recorrido tras inserciones y eliminaciones"""
+        rnd = random.Random(7)
+        avl = AVL()
+        palabras = [f"w{rnd.randint(0, 300)}" for _ in range(1500)]
+        for i, p in enumerate(palabras):
+            avl.insertar(p, i, 1)
+        for p in palabras[:200:3]:
+            avl.eliminar(p)
+        orden = [p for p, _ in avl]
+        self.assertEqual(len(avl), len(orden))
+        self.assertEqual(avl.raiz.total, sum(len(pos) for _, pos in avl))
+        # Una palabra repetida no cambia la forma del árbol, solo los totales
+        raiz, total = avl.raiz, avl.raiz.total
+        avl.insertar(orden[-1], 99999, 1)
+        self.assertIs(avl.raiz, raiz)
+        self.assertEqual(avl.raiz.total, total + 1)
+        self.assertEqual(avl.ocurrencias_menores(orden[-1]) + len(avl.buscar(orden[-1])), total + 1)
+        for k, p in enumerate(orden):
+            self.assertEqual(avl.select(k)[0], p)
+            self.assertEqual(avl.rank(p), k)
+        self.assertEqual(avl.contar_rango("w1", "w2"), sum(1 for p in orden if "w1" <= p <= "w2"))
+        self.assertEqual(avl.contar_rango("w2", "w1"), 0)
+        self.assertEqual(avl.percentil(0)[0], orden[0])
+        self.assertEqual(avl.percentil(100)[0], orden[-1])
+        with self.assertRaises(IndexError):
+            avl.select(len(orden))
+
+    def test_btree_disco(self):
+        """El índice B+ en disco conserva el contenido al cerrarse y reabrirse"""
+        rnd = random.Random(3)
+        esperado = {}
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "indice.btx")
+            with BTreeDisco(ruta, capacidad_cache=16) as indice:
+                for i in range(4000):
+                    p = f"palabra{rnd.randint(0, 1500)}"
+                    indice.insertar(p, i, 1)
+                    esperado.setdefault(p, []).append((i, 1))
+                for p in list(esperado)[:100]:
+                    indice.eliminar(p)
+                    del esperado[p]
+            with BTreeDisco(ruta) as indice:
+                self.assertEqual(len(indice), len(esperado))
+                self.assertEqual(indice.inorden(), sorted(esperado.items()))
+                p = next(iter(esperado))
+                self.assertEqual(indice.buscar(p), esperado[p])
+                self.assertIsNone(indice.buscar("inexistente"))
+
+    def test_btree_disco_postings_compactos(self):
+        """Con frecuencias tipo Zipf las posiciones no dejan páginas casi vacías"""
+        rnd = random.Random(9)
+        vocabulario = [f"p{i}" for i in range(600)] + ["x" * 200 + str(i) for i in range(20)]
+        esperado = {}
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "indice.btx")
+            with BTreeDisco(ruta, capacidad_cache=16) as indice:
+                for i in range(20000):
+                    p = vocabulario[min(int(rnd.paretovariate(0.8)) - 1, len(vocabulario) - 1)]
+                    indice.insertar(p, i, 2)
+                    esperado.setdefault(p, []).append((i, 2))
+            with BTreeDisco(ruta) as indice:
+                self.assertEqual(indice.inorden(), sorted(esperado.items()))
+            self.assertLess(os.path.getsize(ruta), 2 * 8 * 20000)  # El doble de los pares crudos
+
+    def test_guardar_y_cargar_avl(self):
+        """Un AVL guardado se recupera igual, balanceado y con sus aumentos"""
+        palabras = [f"w{i % 700}" for i in range(3000)] + ["año", "niño"]
+        avl = self.construir(AVL, palabras)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "indice.avl")
+            avl.guardar(ruta)
+            cargado = AVL.cargar(ruta)
+        self.assertEqual(cargado.inorden(), avl.inorden())
+        self.assertEqual(len(cargado), len(avl))
+        self.assertEqual(cargado.raiz.total, len(palabras))
+        self.assertLessEqual(cargado.raiz.altura, avl.raiz.altura)
+        cargado.insertar("w0", 9, 9)
+        self.assertEqual(cargado.buscar("w0")[-1], (9, 9))
+        # Cada palabra tiene su propio corte de pares: agregar a una no toca a la siguiente
+        self.assertIsInstance(cargado.buscar("w1"), Posiciones)
+        self.assertEqual(cargado.buscar("w1"), avl.buscar("w1"))
+
+    def test_motores_equivalentes(self):
+        """Todas las estructuras responden igual ante la misma secuencia de operaciones"""
+        rnd = random.Random(11)
+        operaciones = []
+        for i in range(3000):
+            p = f"w{rnd.randint(0, 400)}"
+            operaciones.append(("eliminar" if rnd.random() < 0.15 else "insertar", p, i))
+        esperado = None
+        for clase in MOTORES:
+            indice = clase()
+            for op, p, i in operaciones:
+                if op == "insertar":
+                    indice.insertar(p, i, 1)
+                else:
+                    indice.eliminar(p)
+            resultado = (indice.inorden(), indice.buscar("w7"), indice.buscar("x"))
+            if esperado is None:
+                esperado = resultado
+            self.assertEqual(resultado, esperado, clase.__name__)
+
+    def test_rojinegro_invariantes(self):
+        """Raíz negra, sin rojos consecutivos y misma altura negra en todo camino"""
+        rn = ArbolRojinegro()
+        rnd = random.Random(5)
+        for i in range(2000):
+            rn.insertar(f"w{rnd.randint(0, 800)}", i, 1)
+            if i % 3 == 0:
+                rn.eliminar(f"w{rnd.randint(0, 800)}")
+
+        def altura_negra(nodo):
+            if nodo is rn.nulo:
+                return 1
+            if nodo.rojo:
+                self.assertFalse(nodo.izquierdo.rojo or nodo.derecho.rojo)
+            izquierda = altura_negra(nodo.izquierdo)
+            self.assertEqual(izquierda, altura_negra(nodo.derecho))
+            return izquierda + (0 if nodo.rojo else 1)
+
+        self.assertFalse(rn.raiz.rojo)
+        altura_negra(rn.raiz)
+
+    def test_tokenizar(self):
+        """El tokenizador limpia puntuación, pasa a minúsculas y numera desde 1"""
+        lineas = iter(['¿Quién? "Don" Quijote, (el) hidalgo.\n', '\n', 'Sancho: ¡sí!\n'])
+        tokens = list(tokenizar(lineas))
+        self.assertEqual(tokens[:3], [("¿quién", 1, 1), ("don", 1, 2), ("quijote", 1, 3)])
+        self.assertEqual(tokens[-2:], [("sancho", 3, 1), ("¡sí", 3, 2)])
+
+    def test_indexacion_paralela(self):
+        """La construcción por fragmentos produce el mismo índice que la secuencial"""
+        rnd = random.Random(2)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "corpus.txt")
+            with open(ruta, 'w', encoding='utf-8') as f:
+                for _ in range(400):
+                    f.write(" ".join(f"w{rnd.randint(0, 90)}," for _ in range(rnd.randint(0, 12))) + "\n")
+                f.write("última línea sin salto")
+            secuencial = AVL()
+            for palabra, linea, columna in tokens_de_archivo(ruta):
+                secuencial.insertar(palabra, linea, columna)
+            for procesos in (1, 2):
+                paralelo = construir_avl_paralelo(ruta, procesos=procesos, partes=7)
+                self.assertEqual(paralelo.inorden(), secuencial.inorden())
+
+    def test_indexacion_paralela_saltos_de_linea(self):
+        """Con saltos '\r', '\r\n' y '\n' la numeración paralela coincide con la secuencial"""
+        rnd = random.Random(5)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "corpus.txt")
+            with open(ruta, 'w', encoding='utf-8', newline='') as f:
+                for _ in range(300):
+                    f.write(" ".join(f"w{rnd.randint(0, 60)}" for _ in range(rnd.randint(0, 6))))
+                    f.write(rnd.choice(("\r", "\r", "\r\n", "\n")))
+            secuencial = AVL()
+            for palabra, linea, columna in tokens_de_archivo(ruta):
+                secuencial.insertar(palabra, linea, columna)
+            for partes in (1, 7, 64, 1000):
+                paralelo = construir_avl_paralelo(ruta, procesos=1, partes=partes)
+                self.assertEqual(paralelo.inorden(), secuencial.inorden())
+
+    def test_indice_incremental(self):
+        """Tras ediciones, el índice incremental coincide con uno reconstruido"""
+        versiones = [
+            "el perro come\nel gato duerme\nla casa azul\n",
+            "el perro come\nel gato duerme\nla casa azul\n",
+            "titulo nuevo\nel perro come\nel gato juega\nla casa azul\n",
+            "el perro come\nla casa azul y el gato\n",
+        ]
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "doc.txt")
+            incrementales = [IndiceIncremental(BST()), IndiceIncremental(AVL())]
+            for version in versiones:
+                with open(ruta, 'w', encoding='utf-8') as f:
+                    f.write(version)
+                for incremental in incrementales:
+                    incremental.actualizar(ruta)
+                    completo = incremental.indice.__class__()
+                    for palabra, linea, columna in tokens_de_archivo(ruta):
+                        completo.insertar(palabra, linea, columna)
+                    self.assertEqual(incremental.indice.inorden(), completo.inorden())
+            self.assertEqual(incrementales[1].actualizar(ruta), (0, 0))
+            avl = incrementales[1].indice
+            self.assertEqual(avl.raiz.total, sum(len(p) for _, p in avl))
+
+    def test_buscar_muchos(self):
+        """La búsqueda en lote coincide con búsquedas individuales"""
+        rnd = random.Random(4)
+        consultas = [f"w{rnd.randint(0, 300)}" for _ in range(200)] + ["a", "zzz"]
+        for clase in (BST, AVL):
+            arbol = self.construir(clase, [f"w{rnd.randint(0, 250)}" for _ in range(800)])
+            resultados = arbol.buscar_muchos(consultas)
+            self.assertEqual(set(resultados), set(consultas))
+            for p in consultas:
+                self.assertEqual(resultados[p], arbol.buscar(p))
+            self.assertEqual(clase().buscar_muchos(["x"]), {"x": None})
+
+    def test_indice_con_cache(self):
+        """La caché cuenta aciertos/fallos y se invalida al modificar el índice"""
+        cache = IndiceConCache(self.construir(AVL), capacidad=2)
+        self.assertEqual(cache.buscar("perro"), [(1, 1), (1, 6)])
+        self.assertEqual(cache.buscar("perro"), [(1, 1), (1, 6)])
+        self.assertIsNone(cache.buscar("raton"))
+        cache.insertar("raton", 2, 1)
+        self.assertEqual(cache.buscar("raton"), [(2, 1)])
+        cache.eliminar("perro")
+        self.assertIsNone(cache.buscar("perro"))
+        cache.buscar("gato")
+        estadisticas = cache.estadisticas()
+        self.assertEqual((estadisticas["aciertos"], estadisticas["fallos"]), (1, 5))
+        self.assertEqual(estadisticas["entradas"], 2)
+
+    def test_benchmark(self):
+        """Percentiles, generación de claves y métricas por estructura"""
+        r = resumen([5, 1, 3, 2, 4])
+        self.assertEqual((r["min"], r["p50"], r["media"]), (1, 3, 3))
+        self.assertAlmostEqual(r["p90"], 4.6)
+        self.assertEqual(generar_claves("ordenada", 50), sorted(generar_claves("aleatoria", 50)))
+        self.assertLessEqual(len(set(generar_claves("zipf", 500))), 50)
+        claves = generar_claves("aleatoria", 300)
+        metricas = medir_estructura(AVL, claves, claves[:20], repeticiones=2)
+        self.assertEqual(metricas["altura"], altura_de(self.construir(AVL, claves)))
+        self.assertGreater(metricas["rotaciones"], 0)
+        self.assertGreater(metricas["busqueda"]["p50"], 0)
+
+    def test_instrumentacion(self):
+        """Los contadores registran rotaciones por caso, creaciones y profundidad"""
+        avl = AVLInstrumentado()
+        for i, p in enumerate(["c", "b", "a", "x", "y", "m", "n"]):
+            avl.insertar(p, 1, i)
+        e = avl.estadisticas
+        self.assertEqual(e.nodos_creados, 7)
+        self.assertEqual(e.rotaciones["LL"], 1)
+        self.assertEqual(e.rotaciones["RR"], 1)
+        self.assertEqual(e.rotaciones["RL"], 1)
+        self.assertEqual(sum(e.rotaciones.values()), 3)
+        self.assertEqual([p for p, _ in avl], ["a", "b", "c", "m", "n", "x", "y"])
+
+        bst = self.construir(BST)
+        estadisticas = instrumentar(bst)
+        self.assertIsInstance(bst, BSTInstrumentado)
+        bst.buscar("zorro")
+        self.assertEqual(estadisticas.nodos_visitados, 2)
+        self.assertEqual(estadisticas.comparaciones, 3)
+        self.assertEqual(estadisticas.profundidad_maxima, 2)
+        bst.insertar("zzz", 1, 1)
+        self.assertEqual(estadisticas.nodos_creados, 1)
+        desinstrumentar(bst)
+        self.assertIs(type(bst), BST)
+        self.assertFalse(hasattr(bst, "estadisticas"))
+
+    def test_splay_sube_palabras_consultadas(self):
+        """Una palabra buscada queda en la raíz del árbol splay"""
+        splay = self.construir(ArbolSplay, [f"w{i:03d}" for i in range(300)])
+        self.assertEqual(splay.buscar("w007"), [(1, 8)])
+        self.assertEqual(splay.raiz.palabra, "w007")
+        self.assertIsNone(splay.buscar("w0075"))
+        self.assertEqual([p for p, _ in splay], [f"w{i:03d}" for i in range(300)])
+
+    def test_radix_comparte_prefijos(self):
+        """El árbol radix parte y vuelve a compactar aristas con prefijos comunes"""
+        palabras = ["caballero", "caballera", "caballeros", "caballo", "casa", "ca", "c"]
+        radix = self.construir(ArbolRadix, palabras)
+        self.assertEqual(list(radix.raiz.hijos), ["c"])
+        self.assertEqual(sorted(radix._buscar_nodo("caballer").hijos), ["a", "o"])
+        self.assertIsNone(radix.buscar("caballer"))
+        self.assertIsNone(radix.buscar("caballeroz"))
+        self.assertEqual([p for p, _ in radix.con_prefijo("caball")],
+                         ["caballera", "caballero", "caballeros", "caballo"])
+        self.assertEqual([p for p, _ in radix.con_prefijo("cab")], [p for p, _ in radix.con_prefijo("caball")])
+        self.assertEqual(list(radix.con_prefijo("cz")), [])
+
+        radix.eliminar("caballera")
+        radix.eliminar("caballo")
+        # Sin caballera ni caballo, "caball" + "ero" vuelve a ser una sola arista
+        self.assertEqual(radix._buscar_nodo("caballero").etiqueta, "ballero")
+        self.assertEqual([p for p, _ in radix], ["c", "ca", "caballero", "caballeros", "casa"])
+
+    def test_avl_persistente(self):
+        """Las instantáneas no cambian y los lectores concurrentes ven árboles completos"""
+        rnd = random.Random(11)
+        indice = AVLPersistente()
+        referencia = AVL()
+        for i in range(2000):
+            p = f"w{rnd.randint(0, 400)}"
+            if rnd.random() < 0.2:
+                indice.eliminar(p)
+                referencia.eliminar(p)
+            else:
+                indice.insertar(p, i, 1)
+                referencia.insertar(p, i, 1)
+        self.assertEqual([(p, list(pos)) for p, pos in indice], list(referencia))
+        self.assertLessEqual(altura_de(indice), altura_de(referencia) + 1)
+
+        foto = indice.instantanea()
+        contenido = foto.inorden()
+        for p, _ in contenido[::2]:
+            indice.eliminar(p)
+        indice.insertar("nueva", 1, 1)
+        self.assertEqual(foto.inorden(), contenido)
+        self.assertIsNone(foto.buscar("nueva"))
+        self.assertEqual(indice.buscar("nueva"), ((1, 1),))
+
+        # Un escritor inserta mientras los lectores buscan y recorren sin locks
+        fijas = [p for p, _ in indice]
+        errores = []
+        terminado = threading.Event()
+
+        def lector():
+            while not terminado.is_set():
+                if any(indice.buscar(p) is None for p in fijas):
+                    errores.append("palabra perdida")
+                orden = [p for p, _ in indice]
+                if orden != sorted(orden):
+                    errores.append("recorrido desordenado")
+
+        lectores = [threading.Thread(target=lector) for _ in range(4)]
+        for hilo in lectores:
+            hilo.start()
+        for i in range(3000):
+            indice.insertar(f"x{i}", i, 1)
+            indice.eliminar(f"x{i - 50}")
+        terminado.set()
+        for hilo in lectores:
+            hilo.join()
+        self.assertEqual(errores, [])
+
+    def test_buscar_aproximado(self):
+        """El árbol BK encuentra lo mismo que comparar contra todo el vocabulario"""
+        self.assertEqual(distancia_edicion("caballero", "cabalero"), 1)
+        self.assertEqual(distancia_edicion("gato", "pato"), 1)
+        self.assertEqual(distancia_edicion("", "mesa"), 4)
+        avl = AVL()
+        for palabra, linea, columna in tokens_de_archivo(DATOS_PRUEBA):
+            avl.insertar(palabra, linea, columna)
+        aproximado = IndiceAproximado(avl)
+        for consulta in ("caballerp", "quijte", "mancha", "zzzz"):
+            for max_dist in (0, 1, 2):
+                esperado = sorted((distancia_edicion(consulta, p), p) for p, _ in avl
+                                  if distancia_edicion(consulta, p) <= max_dist)
+                obtenido = aproximado.buscar_aproximado(consulta, max_dist)
+                self.assertEqual([(d, p) for p, d, _ in obtenido], esperado)
+        palabra, distancia, posiciones = aproximado.buscar_aproximado("caballerp")[0]
+        self.assertEqual((palabra, distancia), ("caballero", 1))
+        self.assertIs(posiciones, avl.buscar("caballero"))
+
+        aproximado.insertar("caballerq", 1, 1)
+        aproximado.eliminar("caballero")
+        self.assertEqual([p for p, _, _ in aproximado.buscar_aproximado("caballerp")], ["caballerq"])
+
+    def test_benchmark_todos_los_motores(self):
+        """medir_estructura funciona con cada estructura registrada en main.MOTORES"""
+        claves = generar_claves("zipf", 300)
+        for nombre, clase in MOTORES_MAIN.items():
+            with self.subTest(motor=nombre):
+                metricas = medir_estructura(clase, claves, claves[:20], repeticiones=1)
+                self.assertGreater(metricas["busqueda"]["p50"], 0)
+        radix = self.construir(ArbolRadix, ["caballero", "caballera", "casa"])
+        # raíz -> "ca" -> "baller" -> "o"/"a"
+        self.assertEqual(altura_de(radix), 4)
+
+    def test_posiciones_compactas(self):
+        """Posiciones se comporta como una lista de tuplas (linea, columna)"""
+        posiciones = Posiciones.de_par(3, 1)
+        posiciones.append((1, 7))
+        posiciones.extend([(2, 5), (1, 2)])
+        self.assertEqual(len(posiciones), 4)
+        self.assertEqual(posiciones, [(3, 1), (1, 7), (2, 5), (1, 2)])
+        self.assertEqual(posiciones[-1], (1, 2))
+        self.assertEqual(posiciones[1:3], [(1, 7), (2, 5)])
+        self.assertIn((2, 5), posiciones)
+        posiciones.sort()
+        self.assertEqual(list(posiciones), [(1, 2), (1, 7), (2, 5), (3, 1)])
+        posiciones[:] = [(9, 9)]
+        self.assertEqual(posiciones, Posiciones([(9, 9)]))
+        self.assertNotEqual(posiciones, [(9, 8)])
+        with self.assertRaises(IndexError):
+            posiciones[1]
+        avl = self.construir(AVL)
+        self.assertIsInstance(avl.buscar("perro"), Posiciones)
+        self.assertEqual(avl.buscar("perro"), [(1, 1), (1, 6)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+# Signos de puntuación que se descartan al separar palabras
+PUNTUACION = '.,?!;:"()'
+TABLA_LIMPIEZA = str.maketrans('', '', PUNTUACION)
+
+def leer_lineas(ruta):
+    """Genera las líneas del archivo una a una, sin cargarlo completo."""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        yield from f
+
+def palabras_de_linea(linea):
+    """Limpieza básica: quitar signos de puntuación y convertir a minúsculas."""
+    return linea.translate(TABLA_LIMPIEZA).lower().split()
+
+def tokenizar(lineas):
+    """Genera tuplas (palabra, linea, columna) a partir de un iterable de líneas."""
+    for num_linea, linea in enumerate(lineas, 1):
+        for num_col, palabra in enumerate(palabras_de_linea(linea), 1):
+            yield (palabra, num_linea, num_col)
+
+def tokens_de_archivo(ruta):
+    """Flujo perezoso de tokens de un archivo de texto."""
+    return tokenizar(leer_lineas(ruta))
+
+if __name__ == "__main__":
+    for i, token in enumerate(tokens_de_archivo("test_data.txt")):
+        if i >= 10:
+            break
+        print(token)